@@ -7,44 +7,66 @@ import re
 from typing import List, Dict, Optional
 from collections import defaultdict
 
+# All reporter formats merged into one alternation with a named group per
+# type, so extract_citations makes a single pass over the text and sorts
+# each match into its bucket via m.lastgroup. AIR keeps its original
+# case-insensitivity through a scoped (?i:...) flag.
+_CITATION_RE = re.compile(
+    r'(?P<SCC>\(\d{4}\)\s*\d+\s*SCC\s*\d+(?:\s*\([A-Z]+\))?)'
+    r'|(?P<SCR>\(\d{4}\)\s*\d+\s*SCR\s*\d+)'
+    r'|(?P<AIR>(?i:AIR\s+\d{4}\s+(?:SC|Supreme Court|Delhi|Bombay|Calcutta|Madras|[A-Z]{2,})\s+\d+))'
+    r'|(?P<SCC_Online>\d{4}\s+SCC\s+OnLine\s+(?:SC|[A-Z]{2,})\s+\d+)'
+)
+
+# Constitution articles and Section-of-Act references likewise share one
+# scan of the text instead of two separate finditer passes.
+_REFERENCE_RE = re.compile(
+    r'(?P<article>(?i:\b(?:Article|Art\.?)\s+\d+[A-Z]?(?:\(\d+\))?(?:\s+of\s+the\s+Constitution)?))'
+    r'|(?P<section>Section\s+\d+[A-Z]?(?:\s*\([a-z0-9]+\))?\s+(?:of\s+(?:the\s+)?)?'
+    r'(?P<act>[A-Z][A-Za-z\s,]+Act(?:\s*,?\s*\d{4})?))'
+)
+_ART_ABBREV_RE = re.compile(r'\bArt\.?\s+', re.I)
+
+# Footnote: superscript number followed by content, e.g.
+# "¹ See Ram v. Shyam (2023) 5 SCC 123". The tempered, bounded character
+# class stops at the next superscript marker, a blank line, or 500 chars
+# without the backtracking of the old lazy .+? / lookahead / re.DOTALL
+# combination, and the {11,500} bound replaces the per-match length check.
+_FOOTNOTE_RE = re.compile(
+    r'[¹²³⁴⁵⁶⁷⁸⁹⁰]+\s*((?:(?!\n\n)[^¹²³⁴⁵⁶⁷⁸⁹⁰]){11,500})')
+
+# structure_precedent: case name precedes the citation; the three reporter
+# formats share one search with the year captured in place per alternative.
+_CASE_NAME_RE = re.compile(r'^(.+?)\s*(?:\(\d{4}\)|\bAIR\b|\d{4}\s+SCC)')
+_PRECEDENT_CITE_RE = re.compile(
+    r'(?P<citation>\((?P<y1>\d{4})\)\s*\d+\s*SCC\s*\d+'
+    r'|AIR\s+(?P<y2>\d{4})\s+\w+\s+\d+'
+    r'|(?P<y3>\d{4})\s+SCC\s+OnLine\s+\w+\s+\d+)')
+
+# categorize_precedents court-level markers
+_SC_CITATION_RE = re.compile(r'\b(?:scc|scr|scc\s+online\s+sc|air\s+\d+\s+sc)\b', re.I)
+_HC_CITATION_RE = re.compile(r'\bair\s+\d+\s+(?:delhi|bombay|madras|calcutta)\b', re.I)
+
 
 def extract_citations(text: str) -> Dict[str, List[str]]:
     """
     Extract structured citations from judgment text.
-    
+
     Returns:
         Dict with citation types: SCC, SCR, AIR, etc.
     """
     if not text:
         return {}
-    
-    citations = defaultdict(list)
-    
-    # SCC citations: (2023) 5 SCC 123
-    scc_pattern = r'\(\d{4}\)\s*\d+\s*SCC\s*\d+(?:\s*\([A-Z]+\))?'
-    for match in re.finditer(scc_pattern, text):
-        citations['SCC'].append(match.group(0).strip())
-    
-    # SCR citations: (2023) 2 SCR 456
-    scr_pattern = r'\(\d{4}\)\s*\d+\s*SCR\s*\d+'
-    for match in re.finditer(scr_pattern, text):
-        citations['SCR'].append(match.group(0).strip())
-    
-    # AIR citations: AIR 2023 SC 789
-    air_pattern = r'AIR\s+\d{4}\s+(?:SC|Supreme Court|Delhi|Bombay|Calcutta|Madras|[A-Z]{2,})\s+\d+'
-    for match in re.finditer(air_pattern, text, re.IGNORECASE):
-        citations['AIR'].append(match.group(0).strip())
-    
-    # Supreme Court Reports: 2023 SCC OnLine SC 1234
-    online_pattern = r'\d{4}\s+SCC\s+OnLine\s+(?:SC|[A-Z]{2,})\s+\d+'
-    for match in re.finditer(online_pattern, text):
-        citations['SCC_Online'].append(match.group(0).strip())
-    
-    # Deduplicate
-    for key in citations:
-        citations[key] = list(dict.fromkeys(citations[key]))
-    
-    return dict(citations)
+
+    # dicts double as insertion-ordered sets, so duplicates are dropped as
+    # they stream in instead of via a dict.fromkeys pass at the end.
+    citations = defaultdict(dict)
+
+    # Single pass; each alternative is named after its citation bucket.
+    for match in _CITATION_RE.finditer(text):
+        citations[match.lastgroup][match.group(0).strip()] = None
+
+    return {key: list(vals) for key, vals in citations.items()}
 
 
 def extract_legal_references(text: str) -> Dict[str, List[str]]:
@@ -54,29 +76,22 @@ def extract_legal_references(text: str) -> Dict[str, List[str]]:
     Returns:
         Dict with reference types
     """
-    references = defaultdict(list)
-    
-    # Constitution articles: Article 14, Art. 21
-    article_pattern = r'\b(?:Article|Art\.?)\s+\d+[A-Z]?(?:\(\d+\))?(?:\s+of\s+the\s+Constitution)?'
-    for match in re.finditer(article_pattern, text, re.IGNORECASE):
-        ref = match.group(0).strip()
-        # Normalize format
-        ref = re.sub(r'\bArt\.?\s+', 'Article ', ref, flags=re.I)
-        references['Constitution'].append(ref)
-    
-    # Sections with act names: Section 138 of NI Act
-    section_act_pattern = r'Section\s+\d+[A-Z]?(?:\s*\([a-z0-9]+\))?\s+(?:of\s+(?:the\s+)?)?([A-Z][A-Za-z\s,]+Act(?:\s*,?\s*\d{4})?)'
-    for match in re.finditer(section_act_pattern, text):
-        section = match.group(0).strip()
-        act = match.group(1).strip()
-        references['Sections'].append(section)
-        references['Acts'].append(act)
-    
-    # Deduplicate
-    for key in references:
-        references[key] = list(dict.fromkeys(references[key]))
-    
-    return dict(references)
+    # Same ordered-set trick as extract_citations: dedupe while streaming.
+    references = defaultdict(dict)
+
+    # Single pass over the text; the article branch keeps its original
+    # case-insensitivity via a scoped (?i:...) flag.
+    for match in _REFERENCE_RE.finditer(text):
+        if match.group('article') is not None:
+            # Constitution articles: Article 14, Art. 21 — normalize format
+            ref = _ART_ABBREV_RE.sub('Article ', match.group(0).strip())
+            references['Constitution'][ref] = None
+        else:
+            # Sections with act names: Section 138 of NI Act
+            references['Sections'][match.group(0).strip()] = None
+            references['Acts'][match.group('act').strip()] = None
+
+    return {key: list(vals) for key, vals in references.items()}
 
 
 def structure_precedent(precedent_str: str) -> Optional[Dict[str, str]]:
@@ -92,38 +107,25 @@ def structure_precedent(precedent_str: str) -> Optional[Dict[str, str]]:
     """
     if not precedent_str:
         return None
-    
+
     # Extract case name (before citation)
-    case_pattern = r'^(.+?)\s*(?:\(\d{4}\)|\bAIR\b|\d{4}\s+SCC)'
-    case_match = re.search(case_pattern, precedent_str)
-    
+    case_match = _CASE_NAME_RE.search(precedent_str)
+
     if not case_match:
         return {"case_name": precedent_str.strip(), "citation": "", "year": ""}
-    
-    case_name = case_match.group(1).strip()
-    
-    # Extract citation
-    citation_patterns = [
-        r'\(\d{4}\)\s*\d+\s*SCC\s*\d+',
-        r'AIR\s+\d{4}\s+\w+\s+\d+',
-        r'\d{4}\s+SCC\s+OnLine\s+\w+\s+\d+'
-    ]
-    
+
+    # Citation and year come from one search: each reporter alternative
+    # captures its year in place, so no per-pattern loop or follow-up
+    # year regex is needed.
     citation = ""
     year = ""
-    
-    for pattern in citation_patterns:
-        cit_match = re.search(pattern, precedent_str)
-        if cit_match:
-            citation = cit_match.group(0).strip()
-            # Extract year
-            year_match = re.search(r'\d{4}', citation)
-            if year_match:
-                year = year_match.group(0)
-            break
-    
+    cit_match = _PRECEDENT_CITE_RE.search(precedent_str)
+    if cit_match:
+        citation = cit_match.group("citation").strip()
+        year = cit_match.group("y1") or cit_match.group("y2") or cit_match.group("y3")
+
     return {
-        "case_name": case_name,
+        "case_name": case_match.group(1).strip(),
         "citation": citation,
         "year": year
     }
@@ -146,18 +148,19 @@ def categorize_precedents(precedents: List[str]) -> Dict[str, List[Dict]]:
         structured = structure_precedent(prec)
         if not structured:
             continue
-        
-        citation = structured.get("citation", "").lower()
-        
-        # Supreme Court indicators
-        if any(marker in citation for marker in ['scc', 'scr', 'air.*sc', 'scc online sc']):
+
+        citation = structured.get("citation", "")
+
+        # One regex search per court level replaces the chain of substring
+        # checks (which also treated 'air.*sc' as a literal, so AIR SC
+        # citations were never recognised).
+        if _SC_CITATION_RE.search(citation):
             categorized["supreme_court"].append(structured)
-        # High Court indicators
-        elif any(marker in citation for marker in ['air.*delhi', 'air.*bombay', 'air.*madras', 'air.*calcutta']):
+        elif _HC_CITATION_RE.search(citation):
             categorized["high_courts"].append(structured)
         else:
             categorized["other"].append(structured)
-    
+
     return categorized
 
 
@@ -169,17 +172,11 @@ def extract_footnotes(text: str) -> List[Dict[str, str]]:
         List of dicts with footnote number and text
     """
     footnotes = []
-    
-    # Pattern: superscript number followed by content
-    # Example: "¹ See Ram v. Shyam (2023) 5 SCC 123"
-    footnote_pattern = r'[¹²³⁴⁵⁶⁷⁸⁹⁰]+\s*(.+?)(?=[¹²³⁴⁵⁶⁷⁸⁹⁰]|\n\n|\Z)'
-    
-    for i, match in enumerate(re.finditer(footnote_pattern, text, re.DOTALL), 1):
-        content = match.group(1).strip()
-        if len(content) > 10:  # Substantial footnote
-            footnotes.append({
-                "number": str(i),
-                "content": content[:500]  # Limit length
-            })
-    
+
+    for i, match in enumerate(_FOOTNOTE_RE.finditer(text), 1):
+        footnotes.append({
+            "number": str(i),
+            "content": match.group(1).strip()
+        })
+
     return footnotes
\ No newline at end of file
@@ -1,285 +1,345 @@
-# pipeline/content_extractor.py
-"""
-Extracts structured narrative content from judgment segments
-"""
-
-import re
-from typing import List, Dict, Optional
-
-
-def clean_text(text: str) -> str:
-    """Clean and normalize text"""
-    if not text:
-        return ""
-    
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove page numbers
-    text = re.sub(r'\bPage\s+\d+\s+of\s+\d+\b', '', text, flags=re.I)
-    
-    # Remove multiple dots/dashes
-    text = re.sub(r'\.{3,}', '...', text)
-    text = re.sub(r'-{3,}', '---', text)
-    
-    return text.strip()
-
-
-def extract_background_facts(body_text: str) -> List[str]:
-    """
-    Extract background facts from the body of judgment
-    
-    Returns:
-        List of fact paragraphs
-    """
-    if not body_text:
-        return []
-    
-    facts = []
-    
-    # Common section headers for facts
-    fact_markers = [
-        r'(?:Background|Facts?|Factual Background|Brief Facts?)',
-        r'(?:Facts? of the Case|Facts? in Brief)',
-        r'(?:Factual Matrix|Genesis of the Case)',
-        r'(?:Brief History|History of the Case)',
-    ]
-    
-    # Try to find facts section
-    for marker in fact_markers:
-        # Look for section starting with marker
-        pattern = rf'(?i)(?:^|\n)\s*(?:{marker})[:\s\-]*\n?((?:.|\n)*?)(?=\n\s*(?:Issue|Argument|Submission|Contention|Analysis|Discussion|Held|ORDER|\Z))'
-        match = re.search(pattern, body_text, re.IGNORECASE | re.MULTILINE)
-        
-        if match:
-            facts_text = match.group(1).strip()
-            if facts_text:
-                # Split into paragraphs (by double newline or numbered points)
-                paragraphs = re.split(r'\n\s*\n+|\n\s*\d+\.', facts_text)
-                
-                for para in paragraphs:
-                    para = clean_text(para)
-                    # Keep substantial paragraphs (at least 50 characters)
-                    if len(para) >= 50 and not re.match(r'^[\d\.\s]+$', para):
-                        facts.append(para)
-                
-                if facts:
-                    return facts[:10]  # Limit to first 10 paragraphs
-    
-    # Fallback: Extract first few substantial paragraphs from body
-    if not facts:
-        # Get text from start until "Issue" or "Argument" section
-        early_text = body_text[:3000]  # First ~3000 chars
-        paragraphs = re.split(r'\n\s*\n+', early_text)
-        
-        for para in paragraphs[:5]:
-            para = clean_text(para)
-            # Skip headers and very short paragraphs
-            if len(para) >= 100 and not re.match(r'^[A-Z\s]+$', para):
-                facts.append(para)
-        
-        return facts[:5]  # Return max 5 paragraphs
-    
-    return facts
-
-
-def extract_issues(body_text: str) -> List[str]:
-    """
-    Extract issues for consideration from the body
-    
-    Returns:
-        List of issues
-    """
-    if not body_text:
-        return []
-    
-    issues = []
-    
-    # Common issue markers
-    issue_markers = [
-        r'Issues? for (?:Consideration|Determination|Decision)',
-        r'Questions? (?:of Law|for Consideration|Raised)',
-        r'Points? for (?:Consideration|Determination)',
-        r'Issues? Raised',
-        r'Issues? Arising',
-    ]
-    
-    for marker in issue_markers:
-        # Look for issues section
-        pattern = rf'(?i)(?:^|\n)\s*(?:{marker})[:\s\-]*\n?((?:.|\n)*?)(?=\n\s*(?:Argument|Submission|Discussion|Analysis|Background|Facts?|Held|ORDER|\Z))'
-        match = re.search(pattern, body_text, re.IGNORECASE | re.MULTILINE)
-        
-        if match:
-            issues_text = match.group(1).strip()
-            
-            # Extract numbered or lettered points
-            # Pattern 1: "1.", "2.", etc.
-            numbered = re.findall(r'(?:^|\n)\s*\d+\.\s*(.+?)(?=\n\s*\d+\.|\n\s*[A-Z][a-z]+:|\Z)', issues_text, re.DOTALL)
-            
-            if numbered:
-                for issue in numbered:
-                    issue = clean_text(issue)
-                    if len(issue) >= 30:  # Substantial issue
-                        issues.append(issue)
-                return issues[:10]  # Max 10 issues
-            
-            # Pattern 2: "(i)", "(ii)", etc.
-            roman = re.findall(r'(?:^|\n)\s*\([ivxIVX]+\)\s*(.+?)(?=\n\s*\([ivxIVX]+\)|\n\s*[A-Z][a-z]+:|\Z)', issues_text, re.DOTALL)
-            
-            if roman:
-                for issue in roman:
-                    issue = clean_text(issue)
-                    if len(issue) >= 30:
-                        issues.append(issue)
-                return issues[:10]
-            
-            # Pattern 3: "Whether..." questions
-            questions = re.findall(r'(?i)(?:^|\n)\s*(Whether\s+.+?)(?=\n\s*(?:Whether|\d+\.|\([ivxIVX]+\)|[A-Z][a-z]+:)|\Z)', issues_text, re.DOTALL)
-            
-            if questions:
-                for q in questions:
-                    q = clean_text(q)
-                    if len(q) >= 30:
-                        issues.append(q)
-                return issues[:10]
-            
-            # Fallback: Split by newlines if structured list
-            lines = [l.strip() for l in issues_text.split('\n') if l.strip()]
-            for line in lines:
-                line = clean_text(line)
-                if len(line) >= 50 and not re.match(r'^[A-Z\s]+$', line):
-                    issues.append(line)
-            
-            if issues:
-                return issues[:10]
-    
-    # Fallback: Look for "Whether" questions anywhere in early body
-    early_body = body_text[:2000]
-    whether_questions = re.findall(
-        r'(?i)(?:^|\n)\s*(Whether\s+.+?[.?])(?=\s*(?:\n|$))',
-        early_body,
-        re.MULTILINE
-    )
-    
-    for q in whether_questions[:5]:
-        q = clean_text(q)
-        if len(q) >= 30:
-            issues.append(q)
-    
-    return issues
-
-
-def extract_order_summary(order_text: str) -> Dict[str, any]:
-    """
-    Extract structured information from the order/conclusion section
-    
-    Returns:
-        Dictionary with decision, directions, and result
-    """
-    if not order_text:
-        return {
-            "decision": "",
-            "directions": [],
-            "result": "Not found",
-            "full_text": ""
-        }
-    
-    order_text = clean_text(order_text)
-    
-    # Extract decision (usually starts with "Held:")
-    decision = ""
-    held_match = re.search(r'(?i)Held\s*:\s*(.+?)(?=\n\s*(?:\d+\.|Therefore|Accordingly|In view|ORDER|Directions?:)|\Z)', order_text, re.DOTALL)
-    if held_match:
-        decision = clean_text(held_match.group(1))
-    
-    # If no "Held:", take first substantial paragraph
-    if not decision:
-        paragraphs = re.split(r'\n\s*\n+', order_text)
-        for para in paragraphs[:3]:
-            para = clean_text(para)
-            if len(para) >= 100:
-                decision = para
-                break
-    
-    # Extract directions/orders
-    directions = []
-    
-    # Look for numbered directions
-    direction_patterns = [
-        r'(?:^|\n)\s*\d+\.\s*(.+?)(?=\n\s*\d+\.|\Z)',
-        r'(?:^|\n)\s*\([a-z]\)\s*(.+?)(?=\n\s*\([a-z]\)|\Z)',
-        r'(?i)(?:^|\n)\s*(?:It is )?(?:ordered|directed|held)\s+that[:\s]*(.+?)(?=\n\s*(?:It is|ORDER|\Z))',
-    ]
-    
-    for pattern in direction_patterns:
-        matches = re.findall(pattern, order_text, re.DOTALL)
-        if matches:
-            for match in matches:
-                direction = clean_text(match)
-                if len(direction) >= 20:
-                    directions.append(direction)
-            if directions:
-                break
-    
-    # Determine result
-    result = "Not determined"
-    
-    result_patterns = [
-        (r'(?i)\b(?:appeal|petition|application)\s+(?:is\s+)?(?:allowed|partly allowed|dismissed|disposed of)\b', 'extracted'),
-        (r'(?i)\bappeal.*?allowed\b', 'Appeal Allowed'),
-        (r'(?i)\bappeal.*?dismissed\b', 'Appeal Dismissed'),
-        (r'(?i)\bappeal.*?partly allowed\b', 'Appeal Partly Allowed'),
-        (r'(?i)\bpetition.*?allowed\b', 'Petition Allowed'),
-        (r'(?i)\bpetition.*?dismissed\b', 'Petition Dismissed'),
-        (r'(?i)\bdisposed of\b', 'Disposed Of'),
-    ]
-    
-    for pattern, result_text in result_patterns:
-        match = re.search(pattern, order_text)
-        if match:
-            if result_text == 'extracted':
-                result = clean_text(match.group(0)).title()
-            else:
-                result = result_text
-            break
-    
-    return {
-        "decision": decision[:1000] if decision else "Not found",  # Limit length
-        "directions": directions[:10],  # Max 10 directions
-        "result": result,
-        "full_text": order_text[:2000] if order_text else ""  # First 2000 chars
-    }
-
-
-def extract_conclusion(order_text: str) -> str:
-    """
-    Extract a brief conclusion statement
-    
-    Returns:
-        Single string summarizing the conclusion
-    """
-    if not order_text:
-        return "Conclusion not found"
-    
-    # Look for conclusion markers
-    conclusion_patterns = [
-        r'(?i)(?:In\s+)?(?:conclusion|result|view of the above)[:\s,]*(.+?)(?=\n\s*ORDER|\Z)',
-        r'(?i)(?:Accordingly|Therefore|Thus|Hence)[,:\s]+(.+?)(?=\n|\Z)',
-        r'(?i)(?:We|The Court)\s+(?:accordingly|therefore|thus)\s+(.+?)(?=\n|\Z)',
-    ]
-    
-    for pattern in conclusion_patterns:
-        match = re.search(pattern, order_text, re.DOTALL)
-        if match:
-            conclusion = clean_text(match.group(1))
-            if len(conclusion) >= 30:
-                return conclusion[:500]  # Max 500 chars
-    
-    # Fallback: last substantial paragraph
-    paragraphs = re.split(r'\n\s*\n+', order_text)
-    for para in reversed(paragraphs):
-        para = clean_text(para)
-        if len(para) >= 50:
-            return para[:500]
-    
-    return "Conclusion not found"
\ No newline at end of file
+# pipeline/content_extractor.py
+"""
+Extracts structured narrative content from judgment segments
+"""
+
+import re
+from typing import List, Dict, Optional
+
+# ---------------------------------------------------------------------------
+# All patterns are compiled once at import. clean_text runs dozens of times
+# per judgment, and the section patterns below used to be re-assembled and
+# recompiled per call; the marker lists are now joined into one alternation
+# per section family.
+# ---------------------------------------------------------------------------
+
+# clean_text
+_WS_RE = re.compile(r'\s+')
+_PAGE_RE = re.compile(r'\bPage\s+\d+\s+of\s+\d+\b', re.I)
+_DOTS_RE = re.compile(r'\.{3,}')
+_DASHES_RE = re.compile(r'-{3,}')
+
+# extract_background_facts
+_FACT_MARKERS = (
+    r'(?:Background|Facts?|Factual Background|Brief Facts?)',
+    r'(?:Facts? of the Case|Facts? in Brief)',
+    r'(?:Factual Matrix|Genesis of the Case)',
+    r'(?:Brief History|History of the Case)',
+)
+# The section is located in two linear steps — find the header, then find
+# the next section heading in the remaining text and slice between them.
+# The old single pattern used a lazy (?:.|\n)*? with a lookahead, which
+# backtracks quadratically on long bodies containing neither marker.
+_FACT_HEADER_RE = re.compile(
+    rf'(?:^|\n)\s*(?:{"|".join(_FACT_MARKERS)})[:\s\-]*\n?', re.IGNORECASE)
+_FACT_END_RE = re.compile(
+    r'\n\s*(?:Issue|Argument|Submission|Contention|Analysis|Discussion|Held|ORDER)',
+    re.IGNORECASE)
+_PARA_OR_POINT_SPLIT_RE = re.compile(r'\n\s*\n+|\n\s*\d+\.')
+_PARA_SPLIT_RE = re.compile(r'\n\s*\n+')
+_NUM_BULLET_RE = re.compile(r'\n\s*\d+\.')
+_NUMERIC_ONLY_RE = re.compile(r'^[\d\.\s]+$')
+_ALL_CAPS_RE = re.compile(r'^[A-Z\s]+$')
+
+# extract_issues
+_ISSUE_MARKERS = (
+    r'Issues? for (?:Consideration|Determination|Decision)',
+    r'Questions? (?:of Law|for Consideration|Raised)',
+    r'Points? for (?:Consideration|Determination)',
+    r'Issues? Raised',
+    r'Issues? Arising',
+)
+# Same two-step header/end slicing as the facts section above.
+_ISSUE_HEADER_RE = re.compile(
+    rf'(?:^|\n)\s*(?:{"|".join(_ISSUE_MARKERS)})[:\s\-]*\n?', re.IGNORECASE)
+_ISSUE_END_RE = re.compile(
+    r'\n\s*(?:Argument|Submission|Discussion|Analysis|Background|Facts?|Held|ORDER)',
+    re.IGNORECASE)
+_NUMBERED_POINT_RE = re.compile(
+    r'(?:^|\n)\s*\d+\.\s*(.+?)(?=\n\s*\d+\.|\n\s*[A-Z][a-z]+:|\Z)', re.DOTALL)
+_ROMAN_POINT_RE = re.compile(
+    r'(?:^|\n)\s*\([ivxIVX]+\)\s*(.+?)(?=\n\s*\([ivxIVX]+\)|\n\s*[A-Z][a-z]+:|\Z)', re.DOTALL)
+_WHETHER_POINT_RE = re.compile(
+    r'(?:^|\n)\s*(Whether\s+.+?)(?=\n\s*(?:Whether|\d+\.|\([ivxIVX]+\)|[A-Z][a-z]+:)|\Z)',
+    re.IGNORECASE | re.DOTALL)
+_WHETHER_EARLY_RE = re.compile(
+    r'(?:^|\n)\s*(Whether\s+.+?[.?])(?=\s*(?:\n|$))', re.IGNORECASE | re.MULTILINE)
+
+# extract_order_summary
+_HELD_RE = re.compile(
+    r'Held\s*:\s*(.+?)(?=\n\s*(?:\d+\.|Therefore|Accordingly|In view|ORDER|Directions?:)|\Z)',
+    re.IGNORECASE | re.DOTALL)
+_DIRECTION_RES = (
+    re.compile(r'(?:^|\n)\s*\d+\.\s*(.+?)(?=\n\s*\d+\.|\Z)', re.DOTALL),
+    re.compile(r'(?:^|\n)\s*\([a-z]\)\s*(.+?)(?=\n\s*\([a-z]\)|\Z)', re.DOTALL),
+    re.compile(r'(?:^|\n)\s*(?:It is )?(?:ordered|directed|held)\s+that[:\s]*(.+?)(?=\n\s*(?:It is|ORDER|\Z))',
+               re.IGNORECASE | re.DOTALL),
+)
+# Result classification is pattern-priority, not leftmost-position: the
+# specific "<appeal|petition|...> is <allowed|...>" form wins over the
+# loose families wherever it appears in the text, so the patterns stay
+# separate and are searched in priority order (precompiled; the common
+# case resolves on the first search).
+_RESULT_RES = (
+    (re.compile(r'\b(?:appeal|petition|application)\s+(?:is\s+)?(?:allowed|partly allowed|dismissed|disposed of)\b', re.I), None),
+    (re.compile(r'\bappeal.*?allowed\b', re.I), 'Appeal Allowed'),
+    (re.compile(r'\bappeal.*?dismissed\b', re.I), 'Appeal Dismissed'),
+    (re.compile(r'\bappeal.*?partly allowed\b', re.I), 'Appeal Partly Allowed'),
+    (re.compile(r'\bpetition.*?allowed\b', re.I), 'Petition Allowed'),
+    (re.compile(r'\bpetition.*?dismissed\b', re.I), 'Petition Dismissed'),
+    (re.compile(r'\bdisposed of\b', re.I), 'Disposed Of'),
+)
+
+# extract_conclusion
+_CONCLUSION_RES = (
+    re.compile(r'(?:In\s+)?(?:conclusion|result|view of the above)[:\s,]*(.+?)(?=\n\s*ORDER|\Z)',
+               re.IGNORECASE | re.DOTALL),
+    re.compile(r'(?:Accordingly|Therefore|Thus|Hence)[,:\s]+(.+?)(?=\n|\Z)',
+               re.IGNORECASE | re.DOTALL),
+    re.compile(r'(?:We|The Court)\s+(?:accordingly|therefore|thus)\s+(.+?)(?=\n|\Z)',
+               re.IGNORECASE | re.DOTALL),
+)
+
+
+def _split_paragraphs(text: str) -> List[str]:
+    """
+    Split a section into paragraphs (blank lines or numbered points).
+    Plain blank-line-separated text takes the str.split fast path;
+    clean_text strips any leftover leading whitespace either way.
+    """
+    if '\n\n' in text and not _NUM_BULLET_RE.search(text):
+        return text.split('\n\n')
+    return _PARA_OR_POINT_SPLIT_RE.split(text)
+
+
+def clean_text(text: str) -> str:
+    """Clean and normalize text"""
+    if not text:
+        return ""
+
+    # Remove excessive whitespace
+    text = _WS_RE.sub(' ', text)
+
+    # Remove page numbers
+    text = _PAGE_RE.sub('', text)
+
+    # Remove multiple dots/dashes
+    text = _DOTS_RE.sub('...', text)
+    text = _DASHES_RE.sub('---', text)
+
+    return text.strip()
+
+
+def extract_background_facts(body_text: str) -> List[str]:
+    """
+    Extract background facts from the body of judgment
+
+    Returns:
+        List of fact paragraphs
+    """
+    if not body_text:
+        return []
+
+    facts = []
+
+    # Try to find facts section: header first, then the next section
+    # heading, slicing the text between the two (linear, no backtracking)
+    match = _FACT_HEADER_RE.search(body_text)
+    if match:
+        tail = body_text[match.end():]
+        nxt = _FACT_END_RE.search(tail)
+        facts_text = (tail[:nxt.start()] if nxt else tail).strip()
+        if facts_text:
+            # Split into paragraphs (by double newline or numbered points)
+            paragraphs = _split_paragraphs(facts_text)
+
+            for para in paragraphs:
+                para = clean_text(para)
+                # Keep substantial paragraphs (at least 50 characters)
+                if len(para) >= 50 and not _NUMERIC_ONLY_RE.match(para):
+                    facts.append(para)
+
+            if facts:
+                return facts[:10]  # Limit to first 10 paragraphs
+
+    # Fallback: Extract first few substantial paragraphs from body
+    if not facts:
+        # Get text from start until "Issue" or "Argument" section
+        early_text = body_text[:3000]  # First ~3000 chars
+        paragraphs = _PARA_SPLIT_RE.split(early_text)
+
+        for para in paragraphs[:5]:
+            para = clean_text(para)
+            # Skip headers and very short paragraphs
+            if len(para) >= 100 and not _ALL_CAPS_RE.match(para):
+                facts.append(para)
+
+        return facts[:5]  # Return max 5 paragraphs
+
+    return facts
+
+
+def extract_issues(body_text: str) -> List[str]:
+    """
+    Extract issues for consideration from the body
+
+    Returns:
+        List of issues
+    """
+    if not body_text:
+        return []
+
+    issues = []
+
+    # Look for issues section: same header-then-next-heading slicing
+    match = _ISSUE_HEADER_RE.search(body_text)
+    if match:
+        tail = body_text[match.end():]
+        nxt = _ISSUE_END_RE.search(tail)
+        issues_text = (tail[:nxt.start()] if nxt else tail).strip()
+
+        # Extract numbered or lettered points
+        # Pattern 1: "1.", "2.", etc.
+        numbered = _NUMBERED_POINT_RE.findall(issues_text)
+
+        if numbered:
+            for issue in numbered:
+                issue = clean_text(issue)
+                if len(issue) >= 30:  # Substantial issue
+                    issues.append(issue)
+            return issues[:10]  # Max 10 issues
+
+        # Pattern 2: "(i)", "(ii)", etc.
+        roman = _ROMAN_POINT_RE.findall(issues_text)
+
+        if roman:
+            for issue in roman:
+                issue = clean_text(issue)
+                if len(issue) >= 30:
+                    issues.append(issue)
+            return issues[:10]
+
+        # Pattern 3: "Whether..." questions
+        questions = _WHETHER_POINT_RE.findall(issues_text)
+
+        if questions:
+            for q in questions:
+                q = clean_text(q)
+                if len(q) >= 30:
+                    issues.append(q)
+            return issues[:10]
+
+        # Fallback: Split by newlines if structured list
+        lines = [l.strip() for l in issues_text.split('\n') if l.strip()]
+        for line in lines:
+            line = clean_text(line)
+            if len(line) >= 50 and not _ALL_CAPS_RE.match(line):
+                issues.append(line)
+
+        if issues:
+            return issues[:10]
+
+    # Fallback: Look for "Whether" questions anywhere in early body
+    early_body = body_text[:2000]
+    whether_questions = _WHETHER_EARLY_RE.findall(early_body)
+
+    for q in whether_questions[:5]:
+        q = clean_text(q)
+        if len(q) >= 30:
+            issues.append(q)
+
+    return issues
+
+
+def extract_order_summary(order_text: str) -> Dict[str, any]:
+    """
+    Extract structured information from the order/conclusion section
+
+    Returns:
+        Dictionary with decision, directions, and result
+    """
+    if not order_text:
+        return {
+            "decision": "",
+            "directions": [],
+            "result": "Not found",
+            "full_text": ""
+        }
+
+    order_text = clean_text(order_text)
+
+    # Extract decision (usually starts with "Held:")
+    decision = ""
+    held_match = _HELD_RE.search(order_text)
+    if held_match:
+        decision = clean_text(held_match.group(1))
+
+    # If no "Held:", take first substantial paragraph
+    if not decision:
+        paragraphs = _PARA_SPLIT_RE.split(order_text)
+        for para in paragraphs[:3]:
+            para = clean_text(para)
+            if len(para) >= 100:
+                decision = para
+                break
+
+    # Extract directions/orders (numbered, lettered, or "ordered that")
+    directions = []
+
+    for pattern in _DIRECTION_RES:
+        matches = pattern.findall(order_text)
+        if matches:
+            for match in matches:
+                direction = clean_text(match)
+                if len(direction) >= 20:
+                    directions.append(direction)
+            if directions:
+                break
+
+    # Determine result (priority order; None = use the matched text itself)
+    result = "Not determined"
+
+    for pattern, label in _RESULT_RES:
+        match = pattern.search(order_text)
+        if match:
+            result = label if label else clean_text(match.group(0)).title()
+            break
+
+    return {
+        "decision": decision[:1000] if decision else "Not found",  # Limit length
+        "directions": directions[:10],  # Max 10 directions
+        "result": result,
+        "full_text": order_text[:2000] if order_text else ""  # First 2000 chars
+    }
+
+
+def extract_conclusion(order_text: str) -> str:
+    """
+    Extract a brief conclusion statement
+
+    Returns:
+        Single string summarizing the conclusion
+    """
+    if not order_text:
+        return "Conclusion not found"
+
+    # Look for conclusion markers
+    for pattern in _CONCLUSION_RES:
+        match = pattern.search(order_text)
+        if match:
+            conclusion = clean_text(match.group(1))
+            if len(conclusion) >= 30:
+                return conclusion[:500]  # Max 500 chars
+
+    # Fallback: last substantial paragraph, walking backwards with rfind so
+    # only the tail is examined instead of splitting the whole order into a
+    # list of paragraphs just to read it in reverse
+    idx = len(order_text)
+    while idx > 0:
+        prev = order_text.rfind('\n\n', 0, idx)
+        para = clean_text(order_text[prev + 2 if prev >= 0 else 0:idx])
+        if len(para) >= 50:
+            return para[:500]
+        idx = prev
+
+    return "Conclusion not found"
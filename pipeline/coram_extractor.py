@@ -1,75 +1,77 @@
-import re
-from typing import List
-
-
-def clean_judge_name(name: str) -> str:
-    """
-    Clean a single judge name by removing honorifics, suffixes, and extra punctuation.
-    """
-    if not name:
-        return ""
-
-    # Remove honorifics and titles
-    name = re.sub(
-        r"\b(Hon'?ble|Honorable|Justice|Mr\.?|Mrs\.?|Ms\.?|Dr\.?|Shri|Smt\.?|Lordship|His Lordship|Her Ladyship)\b",
-        "",
-        name,
-        flags=re.I,
-    )
-
-    # Remove trailing J., JJ., etc.
-    name = re.sub(r"\bJ{1,2}\.?$", "", name.strip(), flags=re.I)
-
-    # Normalize whitespace
-    name = re.sub(r"\s+", " ", name).strip()
-
-    return name
-
-
-def extract_coram(header: str) -> List[str]:
-    """
-    Extract judge names from the header using multiple strategies.
-    """
-    judges = []
-
-    if not header:
-        return judges
-
-    # --- 1. Primary Clue: Text inside square brackets
-    bracket_match = re.findall(r"\[(.*?)\]", header, flags=re.S)
-    if bracket_match:
-        for block in bracket_match:
-            parts = re.split(r",| and ", block)
-            for part in parts:
-                name = clean_judge_name(part)
-                if name:
-                    judges.append(name)
-
-    # --- 2. Secondary Clue: Look for explicit "Coram" or "Bench" lines
-    if not judges:
-        for line in header.splitlines():
-            if re.search(r"\b(Coram|Bench)\b", line, flags=re.I):
-                parts = re.split(r",| and ", line)
-                for part in parts:
-                    name = clean_judge_name(part)
-                    if name:
-                        judges.append(name)
-
-    # --- 3. Tertiary Clue: Look for lines starting with Hon'ble Justice
-    if not judges:
-        for line in header.splitlines():
-            if re.match(r"^\s*Hon'?ble\s+Justice", line, flags=re.I):
-                parts = re.split(r",| and ", line)
-                for part in parts:
-                    name = clean_judge_name(part)
-                    if name:
-                        judges.append(name)
-
-    # Deduplicate while preserving order
-    seen, final = set(), []
-    for j in judges:
-        if j.lower() not in seen:
-            seen.add(j.lower())
-            final.append(j)
-
-    return final
+import re
+from typing import List
+
+# Compiled once at import; clean_judge_name runs per judge per document and
+# used to recompile its three patterns on every call.
+_HONORIFIC_RE = re.compile(
+    r"\b(Hon'?ble|Honorable|Justice|Mr\.?|Mrs\.?|Ms\.?|Dr\.?|Shri|Smt\.?|Lordship|His Lordship|Her Ladyship)\b",
+    re.I)
+_TRAILING_J_RE = re.compile(r"\bJ{1,2}\.?$", re.I)
+_WS_RE = re.compile(r"\s+")
+_BRACKET_RE = re.compile(r"\[(.*?)\]", re.S)
+# Both line cues in one union — the group that matched says whether the
+# line is a Coram/Bench line (preferred) or a bare Hon'ble Justice line.
+_JUDGE_LINE_RE = re.compile(
+    r"\b(?P<coram>Coram|Bench)\b|(?P<honble>^\s*Hon'?ble\s+Justice)", re.I)
+_SPLIT_RE = re.compile(r",| and ")
+
+
+def clean_judge_name(name: str) -> str:
+    """
+    Clean a single judge name by removing honorifics, suffixes, and extra punctuation.
+    """
+    if not name:
+        return ""
+
+    # Remove honorifics and titles
+    name = _HONORIFIC_RE.sub("", name)
+
+    # Remove trailing J., JJ., etc.
+    name = _TRAILING_J_RE.sub("", name.strip())
+
+    # Normalize whitespace
+    name = _WS_RE.sub(" ", name).strip()
+
+    return name
+
+
+def extract_coram(header: str) -> List[str]:
+    """
+    Extract judge names from the header using multiple strategies.
+    """
+    judges = []
+
+    if not header:
+        return judges
+
+    # --- 1. Primary Clue: Text inside square brackets
+    bracket_match = _BRACKET_RE.findall(header)
+    if bracket_match:
+        for block in bracket_match:
+            parts = _SPLIT_RE.split(block)
+            for part in parts:
+                name = clean_judge_name(part)
+                if name:
+                    judges.append(name)
+
+    # --- 2./3. Secondary Clues: explicit "Coram"/"Bench" lines, falling
+    # back to lines starting with Hon'ble Justice. The header is tokenized
+    # into lines once and both cues are checked with one union regex; the
+    # Hon'ble lines are only used when no Coram/Bench line matched.
+    if not judges:
+        coram_lines, honble_lines = [], []
+        for line in header.splitlines():
+            m = _JUDGE_LINE_RE.search(line)
+            if m:
+                (coram_lines if m.lastgroup == "coram" else honble_lines).append(line)
+        for line in coram_lines or honble_lines:
+            for part in _SPLIT_RE.split(line):
+                name = clean_judge_name(part)
+                if name:
+                    judges.append(name)
+
+    # Deduplicate while preserving order (and the first-seen casing)
+    unique = {}
+    for j in judges:
+        unique.setdefault(j.lower(), j)
+    return list(unique.values())
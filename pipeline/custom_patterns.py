@@ -5,6 +5,8 @@
 # Keep this file small (20–100 lines max).
 # Add new rules ONLY when you see repeated extraction errors.
 
+import re
+
 PATTERNS = [
 
     # -----------------------------
@@ -57,6 +59,40 @@ PATTERNS = [
     # -----------------------------
     # Extras
     # -----------------------------
-    {"label": "PETITIONER", "pattern": {"regex": "(?i)Appellant[s]?:\\s+.+$"}},
+    # (the Appellant rule above already covers that form; keep this list
+    # duplicate-free so the EntityRuler never runs the same regex twice)
     {"label": "RESPONDENT", "pattern": {"regex": "(?i)Opposite Party[s]?:\\s+.+$"}}
 ]
+
+
+def _scoped(pattern):
+    # The rules carry a leading global (?i); scope it so the patterns can be
+    # joined into one alternation without clashing inline flags.
+    if pattern.startswith("(?i)"):
+        return f"(?i:{pattern[4:]})"
+    return f"(?:{pattern})"
+
+
+# All rules compiled into a single automaton so a document is scanned once
+# instead of once per rule. Group r<i> maps back to rule i's label.
+_UNION_RE = re.compile(
+    "|".join(f"(?P<r{i}>{_scoped(p['pattern']['regex'])})"
+             for i, p in enumerate(PATTERNS)),
+    re.M)
+_RULE_LABELS = {f"r{i}": p["label"] for i, p in enumerate(PATTERNS)}
+
+
+def match_all(text):
+    """
+    Scan `text` once against every rule in PATTERNS.
+    Returns a list of (label, start, end) triples in document order.
+    """
+    return [(_RULE_LABELS[m.lastgroup], m.start(), m.end())
+            for m in _UNION_RE.finditer(text)]
+
+
+# There is deliberately no spaCy Matcher bridge for these rules: a Matcher
+# REGEX applies to a single token's text, and nearly every rule above needs
+# whitespace spans or line anchors that can never occur inside one token.
+# match_all is the fast path; the union automaton already scans a document
+# once for all rules.
@@ -1,16 +1,177 @@
 # ner_predictor.py
 import re
-from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
+from functools import lru_cache
 
+from pipeline.custom_patterns import match_all as _custom_rule_matches
 
-def load_legalbert_model(model_path='model/legalbert2.0'):
+
+@lru_cache(maxsize=4)
+def load_legalbert_model(model_path='model/legalbert2.0', quantize=True,
+                         batch_size=32, device=None):
     """
     Load the fine-tuned LegalBERT model/pipeline.
+    On a CUDA machine the model is placed on the GPU in FP16 so inference
+    uses tensor cores. On CPU the Linear layers are dynamically quantized
+    to int8 (set quantize=False to keep FP32), which halves the weight
+    memory traffic that dominates CPU inference.
+
+    The pipeline batches `batch_size` windows per forward pass so small
+    inputs share one matmul, and groups B-/I- tokens into entity spans
+    natively (aggregation_strategy="simple") instead of leaving that to a
+    Python loop in post_process_ner.
+
+    Memoized per argument set, so repeated calls (e.g. one per request in
+    a worker) reuse the loaded model instead of re-deserializing ~400MB
+    from disk. torch/transformers import lazily so the regex fallbacks
+    stay usable without paying their import cost.
     """
+    import torch
+    from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
+
     tokenizer = AutoTokenizer.from_pretrained(model_path)
     model = AutoModelForTokenClassification.from_pretrained(model_path)
-    nlp = pipeline("ner", model=model, tokenizer=tokenizer)
-    return nlp
+    if device is None:
+        device = 0 if torch.cuda.is_available() else -1
+    if torch.cuda.is_available():
+        model = model.to("cuda").half()
+    elif quantize:
+        model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8)
+    return pipeline("ner", model=model, tokenizer=tokenizer,
+                    aggregation_strategy="simple",
+                    batch_size=batch_size, device=device)
+
+
+def predict_batch(nlp, texts):
+    """
+    Feed a list of texts straight to the pipeline in one call so the
+    tokenizer and model see them as a single batch.
+    """
+    return nlp(texts)
+
+
+# Sliding-window sizing for long segments: ~1800 chars of legal English is
+# roughly 450 wordpieces, safely under BERT's 512-token limit.
+WINDOW_CHARS = 1800
+WINDOW_OVERLAP = 200
+
+
+def predict_long_texts(nlp, texts):
+    """
+    Run the NER pipeline over arbitrarily long texts in one batched call.
+
+    Each text is split into overlapping character windows sized to stay
+    under the 512-token limit; every window (across all texts) goes through
+    a single pipeline call, then token offsets are shifted back to
+    full-text coordinates and regrouped per input text. Overlap-region
+    duplicates are collapsed later by post_process_ner's set merge.
+    """
+    windows = []
+    owners = []  # (text_index, char_offset) per window
+    for ti, text in enumerate(texts):
+        start = 0
+        while True:
+            windows.append(text[start:start + WINDOW_CHARS])
+            owners.append((ti, start))
+            if start + WINDOW_CHARS >= len(text):
+                break
+            start += WINDOW_CHARS - WINDOW_OVERLAP
+
+    all_preds = nlp(windows)
+
+    merged = [[] for _ in texts]
+    for (ti, offset), window_preds in zip(owners, all_preds):
+        for tok in window_preds:
+            tok = dict(tok)
+            tok["start"] = tok.get("start", 0) + offset
+            tok["end"] = tok.get("end", 0) + offset
+            merged[ti].append(tok)
+    return merged
+
+
+# Fallback pattern families for post_process_ner, unioned into one compiled
+# regex per family so each does a single pass over the judgment instead of
+# one full-text scan per pattern.
+
+# === CASE_NUMBER (Expanded) ===
+# Capture common Indian case styles and canonical abbreviations
+_CASE_PATTERNS = (
+    # Specific forms first
+    r"\bW\.P\.\s*\(C\)\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
+    r"\bW\.A\.\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
+    r"\bCrl\.A\.?\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
+    r"\bC\.A\.?\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
+    r"\bSLP(?:\s*\(C\))?\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
+    r"\bI\.A\.?\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
+    r"\bCrl\.?\.?O\.?P\.?\.?No\.?\s*\d+\s*(?:of\s*\d{4})?\b",  # Crl.O.P.No.20644 of 2025
+    r"\bCrime\s+No\.?\s*\d+\s*(?:of\s*\d{4})?\b",              # Crime No.160 of 2025
+
+    # Generic families (keep at end)
+    r"\b(?:Criminal|Civil)?\s*(?:Appeal|W\.?P\.?|Complaint|RCC|SLP|I\.?A\.?|Crl\.A\.|C\.?C\.?|C\.?R\.?P\.?)\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
+    r"\b(?:Case\s+)?No\.?\s*\d{1,6}(?:/\d{2,4})?\b",
+)
+
+# === DATE (Expanded: ordinals + abbreviated months) ===
+_DATE_PATTERNS = (
+    r"\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b",  # 12.03.2025, 12-03-25
+    r"\b\d{1,2}(?:st|nd|rd|th)?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b",  # 15th March 2025
+    r"\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4}\b",  # 15 Aug 23/2023
+    r"\b\d{1,2}-(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{2,4}\b",      # 15-Aug-23
+)
+# light noise filter (avoid SCC citations, money etc.)
+_DATE_NOISE_RE = re.compile(r"\b(?:SCC|SCR|lakhs?|lakh|crore)\b", re.IGNORECASE)
+
+# === JUDGE === (deliberately case-sensitive, as before)
+_JUDGE_PATTERNS = (
+    r"\bHon[’']?ble\s*(?:Mr\.?|Ms\.?)?\s*Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
+    r"\bJustice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
+    r"\bMr\.?\s+Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
+    r"\bMs\.?\s+Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
+    r"\bCoram\s*:\s*(?:Hon[’']?ble\s*)?(?:Mr\.?|Ms\.?)?\s*Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
+    r"\bBefore\s*:\s*(?:Hon[’']?ble\s*)?(?:Mr\.?|Ms\.?)?\s*Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
+    r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\s*,?\s*J\.\b",
+)
+
+# === single-family patterns ===
+_PROVISION_PATTERN = r"Section\s+\d+[A-Za-z]?(?:\s*\([a-z0-9]+\))?(?:\s+read with\s+Section\s+\d+[A-Za-z]?)?"
+_COURT_PATTERN = (
+    r"Supreme Court(?: of India)?|High Court(?: of [A-Za-z ]+)?"
+    r"|High Court of Judicature at [A-Za-z ]+|District Court(?: of [A-Za-z ]+)?"
+    r"|Judicial Magistrate Court, [A-Za-z ]+")
+_LAWYER_GENERIC_PATTERN = r"\b(?:Mr|Ms|Mrs|Adv|Advocate|Shri|Smt)\.?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b"
+_STATUTE_PATTERN = r"\b(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+)?(?:Act|Code|Rules|Regulations|Constitution)(?:,\s*\d{4})?\b"
+
+# === PRECEDENT ===
+# Anchored on the rare " v. " token, then the party names expand locally
+# (bounded to 80 chars a side). The old pattern started an unbounded lazy
+# scan at every capital letter, which went quadratic on documents with
+# many capitals and no "v." at all.
+_V_RE = re.compile(r"\bv\.?\s")
+_PRECEDENT_LEFT_RE = re.compile(r"[A-Z][A-Za-z.\-&\s]{2,80}$")
+_PRECEDENT_RIGHT_RE = re.compile(
+    r"[A-Z][A-Za-z.\-&\s]{1,80}?(?:\s*\(\d{4}\)\s*\d+\s*SCC\s*\d+)?\b")
+
+# === GPE (very light list, just to seed) ===
+_GPE_CITIES = ("Delhi", "Mumbai", "Bhopal", "Jaora", "Guna", "Gwalior",
+               "Madhya Pradesh", "Chennai", "Hyderabad")
+_GPE_RE = re.compile(rf"\b(?:{'|'.join(_GPE_CITIES)})\b", re.IGNORECASE)
+# Map case-insensitive matches back to the seed list's casing so "DELHI"
+# and "delhi" merge into one entry.
+_GPE_CANON = {c.lower(): c for c in _GPE_CITIES}
+
+# All fallback families fused into one alternation — group name == label —
+# so post_process_ner makes a single pass over the document instead of one
+# finditer scan per family. Case-insensitive families are scoped with (?i:);
+# the judge/lawyer/precedent/statute families stay case-sensitive.
+_FALLBACK_RE = re.compile(
+    f"(?P<CASE_NUMBER>(?i:{'|'.join(f'(?:{p})' for p in _CASE_PATTERNS)}))"
+    f"|(?P<PROVISION>(?i:{_PROVISION_PATTERN}))"
+    f"|(?P<DATE>(?i:{'|'.join(f'(?:{p})' for p in _DATE_PATTERNS)}))"
+    f"|(?P<COURT>(?i:{_COURT_PATTERN}))"
+    f"|(?P<JUDGE>{'|'.join(f'(?:{p})' for p in _JUDGE_PATTERNS)})"
+    f"|(?P<LAWYER>{_LAWYER_GENERIC_PATTERN})"
+    f"|(?P<STATUTE>{_STATUTE_PATTERN})"
+)
 
 
 # Cleaned-up label set (no Witness/Actor)
@@ -20,27 +181,46 @@ ALL_LABELS = [
 ]
 
 
+# normalize_entity runs once per extracted value; its replacement rules are
+# compiled into lookup tables so each value is scanned once per family
+# instead of once per rule.
+_ORG_REPL = {"Ltd": "Limited", "Pvt": "Private", "&": "and"}
+_ORG_NORM_RE = re.compile("|".join(map(re.escape, _ORG_REPL)))
+_ORG_PREFIX_RE = re.compile(r"^(?:In |This Court in\s*)")
+_STATUTE_NORM_RE = re.compile(r"(?P<ni>NI Act|Negotiable Instrument)|(?P<crpc>CrPC)")
+_STATUTE_CANON = {
+    "ni": "Negotiable Instruments Act, 1881",
+    "crpc": "Code of Criminal Procedure, 1973",
+}
+
+
+def _org_sub(m):
+    return _ORG_REPL[m.group(0)]
+
+
 def normalize_entity(label, value):
     """
     Lightweight normalization that is safe to run pre-merge.
     Heavier normalization happens in postprocessing.
     """
     if label == "organization":
-        value = value.replace("Ltd", "Limited").replace("Pvt", "Private").replace("&", "and")
-        if value.startswith("In "):
-            value = value[3:]
-        if value.startswith("This Court in"):
-            value = value.replace("This Court in", "").strip()
+        value = _ORG_NORM_RE.sub(_org_sub, value)
+        prefix = _ORG_PREFIX_RE.match(value)
+        if prefix:
+            value = value[prefix.end():].strip()
         if value.strip() == "Private. Limited":
             return ""
     if label == "statute":
-        if "NI Act" in value or "Negotiable Instrument" in value:
-            value = "Negotiable Instruments Act, 1881"
-        if "CrPC" in value:
-            value = "Code of Criminal Procedure, 1973"
+        m = _STATUTE_NORM_RE.search(value)
+        if m:
+            value = _STATUTE_CANON[m.lastgroup]
     return value.strip()
 
 
+_LEAD_JUNK_RE = re.compile(r'^[\W_]+')
+_CAPITALIZED_LABELS = frozenset({"JUDGE", "PRECEDENT", "PETITIONER", "RESPONDENT"})
+
+
 def clean_bert_output(entities):
     """
     Keep only reasonable spans and standardize capitalization for a few labels.
@@ -49,27 +229,18 @@ def clean_bert_output(entities):
     clean_entities = []
     for label, value in entities:
         value = value.strip()
-        value = re.sub(r'^[\W_]+', '', value)
-        if not value or len(value) < 3:
+        # Most values start clean; only run the junk-stripping regex when
+        # the first character actually is junk.
+        if value and (not value[0].isalnum() or value[0] == '_'):
+            value = _LEAD_JUNK_RE.sub('', value)
+        if len(value) < 3:
             continue
-        if label in {"JUDGE", "PRECEDENT", "PETITIONER", "RESPONDENT"} and len(value) > 1:
+        if label in _CAPITALIZED_LABELS:
             value = value[0].upper() + value[1:]
         clean_entities.append((label, value))
     return clean_entities
 
 
-def _flush_current_span(buffer, text, grouped):
-    """
-    Internal helper to flush the current token-span buffer.
-    """
-    if buffer["entity"]:
-        span = text[buffer["start"]:buffer["end"]]
-        span = re.sub(r'\s+', ' ', span.replace('\n', ' ')).strip(' ,.;:')
-        if len(span) > 1:
-            grouped.append((buffer["entity"], span))
-    buffer.update({"entity": None, "start": None, "end": None})
-
-
 def post_process_ner(text, raw_preds):
     """
     Group BERT token predictions into spans and enrich with fallback regex.
@@ -81,115 +252,122 @@ def post_process_ner(text, raw_preds):
     """
     # ---------- 1) Group BERT token-level predictions into spans ----------
     grouped = []
-    current = {"entity": None, "start": None, "end": None}
-
-    for token in raw_preds:
-        entity = token.get("entity", "O").split("-")[-1]
-        if entity == "O":
-            _flush_current_span(current, text, grouped)
-            continue
-
-        # Continue the same entity
-        if current["entity"] == entity:
-            current["end"] = token["end"]
-        else:
-            _flush_current_span(current, text, grouped)
-            current.update({"entity": entity, "start": token["start"], "end": token["end"]})
 
-    _flush_current_span(current, text, grouped)
+    if raw_preds and "entity_group" in raw_preds[0]:
+        # Pipeline ran with aggregation_strategy="simple": spans are already
+        # grouped in C++, so just clean each one.
+        for token in raw_preds:
+            span = text[token["start"]:token["end"]]
+            span = re.sub(r'\s+', ' ', span.replace('\n', ' ')).strip(' ,.;:')
+            if len(span) > 1:
+                grouped.append((token["entity_group"], span))
+    else:
+        # The current span lives in three local scalars rather than a dict
+        # buffer — this loop runs per token (500+ per document) and local
+        # variable access avoids the dict hashing; rfind-slicing the tag
+        # avoids the list allocation of split("-").
+        cur_label, cur_start, cur_end = None, 0, 0
+
+        def flush():
+            if cur_label:
+                span = re.sub(r'\s+', ' ', text[cur_start:cur_end].replace('\n', ' ')).strip(' ,.;:')
+                if len(span) > 1:
+                    grouped.append((cur_label, span))
+
+        for token in raw_preds:
+            tag = token.get("entity", "O")
+            dash = tag.rfind("-")
+            entity = tag[dash + 1:] if dash >= 0 else tag
+            if entity == "O":
+                flush()
+                cur_label = None
+                continue
+
+            # Continue the same entity
+            if cur_label == entity:
+                cur_end = token["end"]
+            else:
+                flush()
+                cur_label, cur_start, cur_end = entity, token["start"], token["end"]
+
+        flush()
 
     # ---------- 2) Fallback Regex (expanded) ----------
+    # Span-carrying matches collect as (label, start, end, value) so
+    # contained near-duplicates ("Justice K. Patel" inside "Hon'ble
+    # Justice K. Patel") can be collapsed by one sorted sweep below.
+    span_matches = []
+    # Derived values (cleaned substrings with no document span)
     fallback_matches = []
 
-    # === CASE_NUMBER (Expanded) ===
-    # Capture common Indian case styles and canonical abbreviations
-    case_patterns = [
-        # Specific forms first
-        r"\bW\.P\.\s*\(C\)\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
-        r"\bW\.A\.\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
-        r"\bCrl\.A\.?\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
-        r"\bC\.A\.?\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
-        r"\bSLP(?:\s*\(C\))?\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
-        r"\bI\.A\.?\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
-        r"\bCrl\.?\.?O\.?P\.?\.?No\.?\s*\d+\s*(?:of\s*\d{4})?\b",  # Crl.O.P.No.20644 of 2025
-        r"\bCrime\s+No\.?\s*\d+\s*(?:of\s*\d{4})?\b",              # Crime No.160 of 2025
-
-        # Generic families (keep at end)
-        r"\b(?:Criminal|Civil)?\s*(?:Appeal|W\.?P\.?|Complaint|RCC|SLP|I\.?A\.?|Crl\.A\.|C\.?C\.?|C\.?R\.?P\.?)\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b",
-        r"\b(?:Case\s+)?No\.?\s*\d{1,6}(?:/\d{2,4})?\b",
-    ]
-    for pattern in case_patterns:
-        for m in re.finditer(pattern, text, re.IGNORECASE):
-            val = m.group(0).strip()
-            fallback_matches.append(("CASE_NUMBER", val))
-
-    # === PROVISION ===
-    provision_pattern = r"Section\s+\d+[A-Za-z]?(?:\s*\([a-z0-9]+\))?(?:\s+read with\s+Section\s+\d+[A-Za-z]?)?"
-    for m in re.finditer(provision_pattern, text, re.IGNORECASE):
-        fallback_matches.append(("PROVISION", m.group(0).strip()))
-
-    # === DATE (Expanded: ordinals + abbreviated months) ===
-    date_patterns = [
-        r"\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b",  # 12.03.2025, 12-03-25
-        r"\b\d{1,2}(?:st|nd|rd|th)?\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b",  # 15th March 2025
-        r"\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4}\b",  # 15 Aug 23/2023
-        r"\b\d{1,2}-(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{2,4}\b",      # 15-Aug-23
-    ]
-    for pattern in date_patterns:
-        for m in re.finditer(pattern, text, re.IGNORECASE):
-            val = m.group(0).strip()
-            # light noise filter (avoid SCC citations, money etc.)
-            if not re.search(r"\b(SCC|SCR|lakhs?|lakh|crore)\b", val, re.IGNORECASE):
-                fallback_matches.append(("DATE", val))
-
-    # === COURT (basic) ===
-    court_pattern = r"(Supreme Court(?: of India)?|High Court(?: of [A-Za-z ]+)?|High Court of Judicature at [A-Za-z ]+|District Court(?: of [A-Za-z ]+)?|Judicial Magistrate Court, [A-Za-z ]+)"
-    for m in re.finditer(court_pattern, text, re.IGNORECASE):
-        fallback_matches.append(("COURT", m.group(0).strip()))
-
-    # === JUDGE ===
-    judge_patterns = [
-        r"\bHon[’']?ble\s*(?:Mr\.?|Ms\.?)?\s*Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
-        r"\bJustice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
-        r"\bMr\.?\s+Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
-        r"\bMs\.?\s+Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
-        r"\bCoram\s*:\s*(?:Hon[’']?ble\s*)?(?:Mr\.?|Ms\.?)?\s*Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
-        r"\bBefore\s*:\s*(?:Hon[’']?ble\s*)?(?:Mr\.?|Ms\.?)?\s*Justice\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
-        r"\b(A|B|C|D|E|F|G|H|I|J|K|L|M|N|O|P|Q|R|S|T|U|V|W|X|Y|Z)[a-z]+(?:\s+[A-Z][a-z]+)+\s*,?\s*J\.\b",
-    ]
-    for pattern in judge_patterns:
-        for m in re.finditer(pattern, text):
-            fallback_matches.append(("JUDGE", m.group(0).strip()))
-
-    # === LAWYER === (anchored blocks and generic honorifics)
-    # Anchored: "For Petitioner: ..." / "For Respondent: ..."
-    for block in re.findall(r"(?:For\s+(?:Petitioner|Respondent)[^:]*:\s*)([^\n]+)", text, re.IGNORECASE):
-        names = re.findall(r"[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+|[A-Z]\.\s?[A-Z][a-z]+", block)
-        for name in names:
-            n = name.strip()
-            if len(n.split()) >= 2 and n.lower() not in {"information technology"}:
-                fallback_matches.append(("LAWYER", n))
-
-    generic_lawyer = r"\b(?:Mr|Ms|Mrs|Adv|Advocate|Shri|Smt)\.?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b"
-    for m in re.finditer(generic_lawyer, text):
-        fallback_matches.append(("LAWYER", m.group(0).strip()))
-
-    # === PRECEDENT ===
-    precedent_pattern = r"\b[A-Z][A-Za-z.\-&\s]+?\s+v\.?\s+[A-Z][A-Za-z.\-&\s]+?(?:\s*\(\d{4}\)\s*\d+\s*SCC\s*\d+)?\b"
-    for m in re.finditer(precedent_pattern, text):
-        fallback_matches.append(("PRECEDENT", m.group(0).strip()))
-
-    # === STATUTE ===
-    statute_pattern = r"\b(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+)?(?:Act|Code|Rules|Regulations|Constitution)(?:,\s*\d{4})?\b"
-    for m in re.finditer(statute_pattern, text):
+    # High-priority custom rules, all compiled into one automaton and run in
+    # a single pass. Only the span-precise labels are taken; the line-anchored
+    # role rules duplicate the anchored header splitter below, which does the
+    # proper per-name cleanup.
+    for label, start, end in _custom_rule_matches(text):
+        if label in {"CASE_NUMBER", "COURT", "DATE"}:
+            span_matches.append((label, start, end, text[start:end].strip()))
+
+    # === CASE_NUMBER / PROVISION / DATE / COURT / JUDGE / LAWYER /
+    # STATUTE === — one automaton for all families; the matched group name
+    # is the label, and the per-family noise filters run in the dispatch.
+    # The scan resumes just past each match START (not its end) so a match
+    # from another family overlapping the tail of this one still surfaces —
+    # a greedy COURT span must not swallow the CASE_NUMBER inside it. The
+    # shorter same-family re-matches this produces are contained spans and
+    # get dropped by the sweep below.
+    pos = 0
+    while True:
+        m = _FALLBACK_RE.search(text, pos)
+        if not m:
+            break
+        pos = m.start() + 1
+        label = m.lastgroup
         val = m.group(0).strip()
-        if len(val.split()) > 2 and len(val) < 100 and val.lower() not in {"supreme court reports"}:
-            fallback_matches.append(("STATUTE", val))
+        if label == "DATE" and _DATE_NOISE_RE.search(val):
+            continue
+        if label == "STATUTE" and not (
+                len(val.split()) > 2 and len(val) < 100
+                and val.lower() != "supreme court reports"):
+            continue
+        span_matches.append((label, m.start(), m.end(), val))
 
-    # === GPE (very light list, just to seed) ===
-    for city in ["Delhi", "Mumbai", "Bhopal", "Jaora", "Guna", "Gwalior", "Madhya Pradesh", "Chennai", "Hyderabad"]:
-        if city.lower() in text.lower():
-            fallback_matches.append(("GPE", city))
+    # === PRECEDENT === (anchor on "v."/"v ", expand party names locally)
+    for vm in _V_RE.finditer(text):
+        left_base = max(0, vm.start() - 81)
+        lm = _PRECEDENT_LEFT_RE.search(text, left_base, vm.start())
+        if not lm:
+            continue
+        rm = _PRECEDENT_RIGHT_RE.match(text, vm.end())
+        if not rm:
+            continue
+        start, end = lm.start(), rm.end()
+        span_matches.append(("PRECEDENT", start, end, text[start:end].strip()))
+
+    # === LAWYER (anchored blocks) ===
+    # "For Petitioner: ..." / "For Respondent: ..." — structurally a
+    # two-level extraction (line block, then names within), kept separate.
+    for bm in re.finditer(r"(?:For\s+(?:Petitioner|Respondent)[^:]*:\s*)([^\n]+)", text, re.IGNORECASE):
+        base = bm.start(1)
+        for nm in re.finditer(r"[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+|[A-Z]\.\s?[A-Z][a-z]+", bm.group(1)):
+            n = nm.group(0).strip()
+            if len(n.split()) >= 2 and n.lower() not in {"information technology"}:
+                span_matches.append(("LAWYER", base + nm.start(), base + nm.end(), n))
+
+    # === GPE === (boundary-aware union; one scan, no full-text lowercasing)
+    for m in _GPE_RE.finditer(text):
+        span_matches.append(
+            ("GPE", m.start(), m.end(), _GPE_CANON[m.group(0).lower()]))
+
+    # Sweep: sort by start (longest span first at equal starts), then drop
+    # any match wholly contained in a span already kept for its label.
+    span_matches.sort(key=lambda t: (t[1], -(t[2] - t[1])))
+    last_end = {}
+    for label, start, end, val in span_matches:
+        if end <= last_end.get(label, -1):
+            continue
+        last_end[label] = end
+        fallback_matches.append((label, val))
 
     # === PETITIONER / RESPONDENT (Quick Win splitter via anchored headers) ===
     # Example lines:
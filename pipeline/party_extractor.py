@@ -3,66 +3,118 @@
 import re
 from typing import List, Tuple
 
+# All patterns are compiled once at import. _clean_party_chunk runs per
+# name chunk (dozens per header) and used to recompile its fifteen
+# patterns through re's cache on every call.
+
+# _clean_party_chunk: the five "kill everything from this marker to the
+# end" patterns collapse into one search whose leftmost hit truncates the
+# chunk, and the point deletions (suffixes, dates, citations, case
+# numbers) collapse into one union sub — two scans instead of fourteen.
+_TAIL_KILL_RE = re.compile(
+    r'\b(?:Petitioner|Appellant|Respondent|Defendant)\b'   # role markers
+    r'|\bCriminal\s+Appeal\b'
+    r'|\bCrl\.?O\.?P\.?\b'
+    r'|\bRep(?:resented)?\.?\s+by\b'
+    r'|\bThrough\b',
+    re.I)
+_NOISE_RE = re.compile(
+    r'\b(?:&\s*Anr\.?|&\s*Ors\.?|and\s+Another|and\s+Others)\b'  # suffixes
+    r'|\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b'                      # dates
+    r'|\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\b'
+    r'|\[\d{4}\]'                                                # citations
+    r'|\(\d{4}\)'
+    r'|\b(?:SCC|SCR|INSC|AIR)\s+\d+'
+    r'|\bNo\.?\s*\d+',                                           # case numbers
+    re.I)
+_TRAIL_PREP_RE = re.compile(r'\s+(?:in|of|the|at|to)\s*$', re.I)
+
+# _extract_names_from_block
+_CASE_NO_RE = re.compile(r'\bNo\.?\s*\d+', re.I)
+
+# extract_parties: line-level patterns for the single forward scan. The
+# old strategy regexes each re-walked the whole header (six multiline
+# searches, two with backtracking-prone (?:.|\n)*? captures); the same
+# cues are now detected per line in one pass.
+_VERSUS_LINE_RE = re.compile(r'^\s*(?:VERSUS|V[Ss]?\.?)\s*$', re.I)
+_PARTY_LINE_RE = re.compile(r'^[A-Z][A-Z\s\.,&]+$', re.I)
+_INLINE_VERSUS_RE = re.compile(
+    r'([A-Z][A-Za-z\s\.,&]{3,60}?)\s+v\.?s?\.?\s+([A-Z][A-Za-z\s\.,&]{3,60}?)(?=\s*(?:Petitioner|Respondent|Appellant|\(|IN THE|CORAM|Date|$))',
+    re.IGNORECASE)
+_APP_LABEL_RE = re.compile(r'(?:Petitioner|Appellant)(?:\(s\))?\s*[:\-]\s*', re.I)
+_RESP_LABEL_RE = re.compile(r'Respondent(?:\(s\))?\s*[:\-]\s*', re.I)
+_APP_BLOCK_END_RE = re.compile(r'^\s*(?:Respondent|v\.|CORAM|Date|Advocate)', re.I)
+_RESP_BLOCK_END_RE = re.compile(r'^\s*(?:CORAM|Date|Advocate|Appearances)', re.I)
+
 
 def _clean_party_chunk(chunk: str) -> str:
     """Clean a party name chunk from noise, metadata, and trailing junk."""
     if not chunk:
         return ""
-    
-    # Remove common suffixes
-    chunk = re.sub(r'\b(?:&\s*Anr\.?|&\s*Ors\.?|and\s+Another|and\s+Others)\b', '', chunk, flags=re.I)
-    
-    # Remove role markers
-    chunk = re.sub(r'\b(?:Petitioner|Appellant|Respondent|Defendant)\b.*$', '', chunk, flags=re.I)
-    
-    # Remove dates
-    chunk = re.sub(r'\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b', '', chunk)
-    chunk = re.sub(r'\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\b', '', chunk, flags=re.I)
-    
-    # Remove citations
-    chunk = re.sub(r'\[\d{4}\]', '', chunk)
-    chunk = re.sub(r'\(\d{4}\)', '', chunk)
-    chunk = re.sub(r'\b(?:SCC|SCR|INSC|AIR)\s+\d+', '', chunk, flags=re.I)
-    
-    # Remove case numbers
-    chunk = re.sub(r'\bNo\.?\s*\d+', '', chunk, flags=re.I)
-    chunk = re.sub(r'\bCriminal\s+Appeal\b.*$', '', chunk, flags=re.I)
-    chunk = re.sub(r'\bCrl\.?O\.?P\.?\b.*$', '', chunk, flags=re.I)
-    
-    # Remove "Rep. by" and similar
-    chunk = re.sub(r'\bRep(?:resented)?\.?\s+by\b.*$', '', chunk, flags=re.I)
-    chunk = re.sub(r'\bThrough\b.*$', '', chunk, flags=re.I)
-    
+
+    # Drop everything from the earliest tail marker onward
+    m = _TAIL_KILL_RE.search(chunk)
+    if m:
+        chunk = chunk[:m.start()]
+
+    # Delete noise tokens in one pass
+    chunk = _NOISE_RE.sub('', chunk)
+
     # Remove trailing prepositions
-    chunk = re.sub(r'\s+(?:in|of|the|at|to)\s*$', '', chunk, flags=re.I)
-    
-    # Clean whitespace
-    chunk = re.sub(r'\s+', ' ', chunk).strip(' .,;:-')
-    
+    chunk = _TRAIL_PREP_RE.sub('', chunk)
+
+    # Clean whitespace (str.split collapses runs without the regex engine)
+    chunk = ' '.join(chunk.split()).strip(' .,;:-')
+
     return chunk
 
 
+def _split_name_parts(block: str) -> List[str]:
+    """Split a block on name delimiters (',', ';', '&', word 'and') in one
+    linear scan; surrounding whitespace is left for _clean_party_chunk."""
+    parts = []
+    start = 0
+    i = 0
+    n = len(block)
+    while i < n:
+        ch = block[i]
+        if ch in ',;&':
+            parts.append(block[start:i])
+            i += 1
+            start = i
+        elif ch in 'aA' and block[i:i + 3].lower() == 'and' \
+                and (i == 0 or not block[i - 1].isalnum()) \
+                and (i + 3 >= n or not block[i + 3].isalnum()):
+            parts.append(block[start:i])
+            i += 3
+            start = i
+        else:
+            i += 1
+    parts.append(block[start:])
+    return parts
+
+
 def _extract_names_from_block(block: str) -> List[str]:
     """Extract individual names from a cleaned block."""
     if not block:
         return []
-    
+
     # Split on delimiters
-    parts = re.split(r'\s*(?:,|;|\band\b|\&)\s*', block, flags=re.I)
-    
+    parts = _split_name_parts(block)
+
     names = []
     for part in parts:
         part = _clean_party_chunk(part)
-        
+
         if part and len(part) >= 3:
             # Skip if doesn't start with capital
-            if not re.match(r'^[A-Z]', part):
+            if not 'A' <= part[0] <= 'Z':
                 continue
-            
+
             # Skip if contains case number markers
-            if re.search(r'\bNo\.?\s*\d+', part, re.I):
+            if _CASE_NO_RE.search(part):
                 continue
-            
+
             names.append(part)
     
     # Deduplicate
@@ -86,87 +138,87 @@ def extract_parties(header_text: str, entities: dict) -> Tuple[List[str], List[s
     """
     if not header_text:
         return [], []
-    
+
     appellants, respondents = [], []
-    
+
+    # One forward pass over the header lines records everything the
+    # strategies below need: the first VERSUS-only line and the first
+    # Petitioner/Appellant and Respondent label lines (with whether the
+    # label sits at the start of its line).
+    lines = header_text.splitlines()
+    versus_idx = None
+    app_idx = resp_idx = None
+    app_rest = resp_rest = ""
+    app_anchored = resp_anchored = False
+    for i, line in enumerate(lines):
+        if versus_idx is None and _VERSUS_LINE_RE.match(line):
+            versus_idx = i
+        if app_idx is None:
+            m = _APP_LABEL_RE.search(line)
+            if m:
+                app_idx = i
+                app_rest = line[m.end():].strip()
+                app_anchored = not line[:m.start()].strip()
+        if resp_idx is None:
+            m = _RESP_LABEL_RE.search(line)
+            if m:
+                resp_idx = i
+                resp_rest = line[m.end():].strip()
+                resp_anchored = not line[:m.start()].strip()
+
     # === STRATEGY 1: VERSUS Pattern (for formats like Sample 4) ===
-    # Look for "NAME(S)\nVERSUS\nNAME(S)" pattern
-    versus_pattern = re.compile(
-        r'^([A-Z][A-Z\s\.,&]+?)\s*\n\s*(?:VERSUS|V[Ss]?\.?)\s*\n\s*([A-Z][A-Z\s\.,&]+?)(?:\n|$)',
-        re.MULTILINE | re.IGNORECASE
-    )
-    
-    versus_match = versus_pattern.search(header_text)
-    if versus_match:
-        app_block = versus_match.group(1).strip()
-        resp_block = versus_match.group(2).strip()
-        
-        appellants = _extract_names_from_block(app_block)
-        respondents = _extract_names_from_block(resp_block)
-        
-        if appellants and respondents:
-            return appellants, respondents
-    
+    # Caption lines directly around a standalone "VERSUS"/"V." line
+    if versus_idx is not None:
+        j = versus_idx - 1
+        app_block_lines = []
+        while j >= 0 and _PARTY_LINE_RE.match(lines[j]):
+            app_block_lines.insert(0, lines[j])
+            j -= 1
+        k = versus_idx + 1
+        while k < len(lines) and not lines[k].strip():
+            k += 1
+        if app_block_lines and k < len(lines) and _PARTY_LINE_RE.match(lines[k]):
+            appellants = _extract_names_from_block("\n".join(app_block_lines).strip())
+            respondents = _extract_names_from_block(lines[k].strip())
+            if appellants and respondents:
+                return appellants, respondents
+
     # === STRATEGY 2: Inline versus pattern (e.g., "Name v. Name") ===
-    inline_versus = re.compile(
-        r'([A-Z][A-Za-z\s\.,&]{3,60}?)\s+v\.?s?\.?\s+([A-Z][A-Za-z\s\.,&]{3,60}?)(?=\s*(?:Petitioner|Respondent|Appellant|\(|IN THE|CORAM|Date|$))',
-        re.IGNORECASE
-    )
-    
-    inline_match = inline_versus.search(header_text)
+    inline_match = _INLINE_VERSUS_RE.search(header_text)
     if inline_match and not appellants:
         left = _clean_party_chunk(inline_match.group(1).strip())
         right = _clean_party_chunk(inline_match.group(2).strip())
-        
+
         if left and right and len(left) >= 3 and len(right) >= 3:
             appellants = [left]
             respondents = [right]
             return appellants, respondents
-    
+
     # === STRATEGY 3: Labeled Header Lines ===
-    app_match = re.search(
-        r'^\s*(?:Petitioner|Appellant)(?:\(s\))?\s*[:\-]\s*(.+?)$',
-        header_text,
-        re.IGNORECASE | re.MULTILINE
-    )
-    
-    resp_match = re.search(
-        r'^\s*Respondent(?:\(s\))?\s*[:\-]\s*(.+?)$',
-        header_text,
-        re.IGNORECASE | re.MULTILINE
-    )
-    
-    if app_match:
-        block = app_match.group(1).strip()
-        appellants = _extract_names_from_block(block)
-    
-    if resp_match:
-        block = resp_match.group(1).strip()
-        respondents = _extract_names_from_block(block)
-    
+    if app_idx is not None and app_anchored and app_rest:
+        appellants = _extract_names_from_block(app_rest)
+
+    if resp_idx is not None and resp_anchored and resp_rest:
+        respondents = _extract_names_from_block(resp_rest)
+
     # === STRATEGY 4: Multi-line Blocks After Label ===
-    if not appellants:
-        app_block_match = re.search(
-            r'(?:Petitioner|Appellant)(?:\(s\))?\s*[:\-]\s*'
-            r'((?:.|\n)*?)'
-            r'(?=\n\s*(?:Respondent|v\.|CORAM|Date|Advocate|$))',
-            header_text,
-            re.IGNORECASE
-        )
-        if app_block_match:
-            block = app_block_match.group(1).strip()
-            appellants = _extract_names_from_block(block)
-    
-    if not respondents:
-        resp_block_match = re.search(
-            r'Respondent(?:\(s\))?\s*[:\-]\s*'
-            r'((?:.|\n)*?)'
-            r'(?=\n\s*(?:CORAM|Date|Advocate|Appearances|$))',
-            header_text,
-            re.IGNORECASE
-        )
-        if resp_block_match:
-            block = resp_block_match.group(1).strip()
-            respondents = _extract_names_from_block(block)
-    
+    # Rest of the label line plus following lines up to the first
+    # terminator line (what the old lazy multiline capture produced,
+    # without the backtracking)
+    if not appellants and app_idx is not None:
+        block_lines = [app_rest]
+        for line in lines[app_idx + 1:]:
+            if _APP_BLOCK_END_RE.match(line):
+                break
+            block_lines.append(line)
+        appellants = _extract_names_from_block("\n".join(block_lines).strip())
+
+    if not respondents and resp_idx is not None:
+        block_lines = [resp_rest]
+        for line in lines[resp_idx + 1:]:
+            if _RESP_BLOCK_END_RE.match(line):
+                break
+            block_lines.append(line)
+        respondents = _extract_names_from_block("\n".join(block_lines).strip())
+
     return appellants[:5], respondents[:3]
\ No newline at end of file
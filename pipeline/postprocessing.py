@@ -6,19 +6,63 @@ import re
 from collections import defaultdict
 from typing import List, Tuple, Dict
 
+# All patterns compiled once at import; the helpers below run per entity
+# value per document and used to rebuild their patterns through re's
+# cache on every call.
+
+# _normalize_statute: one alternation, replacement looked up per match
+_STATUTE_ABBR_RE = re.compile(r'\b(NI Act|CrPC|IPC|IT Act|BNS)\b', re.I)
+_STATUTE_MAP = {
+    'ni act': 'Negotiable Instruments Act, 1881',
+    'crpc': 'Code of Criminal Procedure, 1973',
+    'ipc': 'Indian Penal Code, 1860',
+    'it act': 'Information Technology Act, 2000',
+    'bns': 'Bharatiya Nyaya Sanhita, 2023',
+}
+
+
+def _statute_sub(m: "re.Match") -> str:
+    return _STATUTE_MAP[m.group(1).lower()]
+
+# _is_probable_lawyer
+_ORG_TOKENS = frozenset({
+    "state", "government", "department", "commission", "bank", "society",
+    "university", "corporation", "limited", "pvt", "ltd", "company", "union",
+})
+
+# _clean_party_name: headers and role labels share one anchored pattern
+_LEAD_JUNK_RE = re.compile(
+    r'^(?:in the\s+supreme\s+court.*|before\s+the.*|civil\s+appellate\s+jurisdiction.*'
+    r'|(?:petitioner|appellant|respondent|defendant|plaintiff)\s*[:\-]\s*)', re.I)
+_CITATION_TAIL_RE = re.compile(r'\(?\d{4}\)?\s*(SCC|SCR|AIR|All ER).*', re.I)
+_TRUNCATE_AT_RE = re.compile(r'\b(?:represented by|through|filed|under)\b', re.I)
+_TRAIL_ROLE_RE = re.compile(
+    r'\b(petitioner|appellant|respondent|defendant|plaintiff)\b$', re.I)
+
+# _deduplicate_precedents
+_PREC_YEAR_TAIL_RE = re.compile(r'\s*\(\d{4}\).*$')
+_PREC_REPORTER_TAIL_RE = re.compile(r'\s+(SCC|SCR|AIR).*$', re.I)
+
+# merge_entities
+_PROVENANCE_RE = re.compile(r'^(.*?)(?:\s*\[(header|body)\])?\s*$')
+_HONBLE_RE = re.compile(r"Hon['’]?\s*ble\.?\s*", re.I)
+_MR_JUSTICE_RE = re.compile(r'\bMr\.?\s+Justice\b')
+_AND_ONLY_RE = re.compile(r'^(and|&|-)$', re.I)
+_JUSTICE_WORD_RE = re.compile(r'justice', re.I)
+_LEAD_HONBLE_RE = re.compile(r"^(Hon['’]?\s*ble\.?\s*)", re.I)
+_CAPS_BANNER_RE = re.compile(r'^[A-Z\s]{3,200}$')
+_LAWYER_ROLE_RE = re.compile(
+    r'\b(Sr\.?\s*Adv|Advocate|Adv\.|A\.S\.G\.?|A\.A\.G\.?|AOR)\b', re.I)
+_V_SPLIT_RE = re.compile(r'\s+v[.]?s?[.]?\s+', re.I)
+
 
 def _clean_whitespace(s: str) -> str:
-    return re.sub(r'\s+', ' ', s or '').strip(' ,;:\n\t')
+    # str.split with no argument collapses whitespace runs in C
+    return ' '.join((s or '').split()).strip(' ,;:')
 
 
 def _normalize_statute(s: str) -> str:
-    s = s.strip()
-    s = re.sub(r'\bNI Act\b', 'Negotiable Instruments Act, 1881', s, flags=re.I)
-    s = re.sub(r'\bCrPC\b', 'Code of Criminal Procedure, 1973', s, flags=re.I)
-    s = re.sub(r'\bIPC\b', 'Indian Penal Code, 1860', s, flags=re.I)
-    s = re.sub(r'\bIT Act\b', 'Information Technology Act, 2000', s, flags=re.I)
-    s = re.sub(r'\bBNS\b', 'Bharatiya Nyaya Sanhita, 2023', s, flags=re.I)
-    return s
+    return _STATUTE_ABBR_RE.sub(_statute_sub, s.strip())
 
 
 def _is_probable_lawyer(name: str) -> bool:
@@ -28,7 +72,7 @@ def _is_probable_lawyer(name: str) -> bool:
     if len(parts) < 2:
         return False
     # Reject obvious organizations / states
-    if re.search(r'\b(state|government|department|commission|bank|society|university|corporation|limited|pvt|ltd|company|union)\b', name, re.I):
+    if not _ORG_TOKENS.isdisjoint(p.strip('.,').lower() for p in parts):
         return False
     # Reject very short tokens
     if len(name) < 4:
@@ -42,70 +86,82 @@ def _clean_party_name(name: str) -> str:
     citations, or unrelated words.
     """
     name = _clean_whitespace(name)
-    # Remove leading court / section headers
-    name = re.sub(r'^(in the\s+supreme\s+court.*|before\s+the.*|civil\s+appellate\s+jurisdiction.*)', '', name, flags=re.I)
-    # Remove labels like 'Petitioner:' / 'Respondent:'
-    name = re.sub(r'^(petitioner|appellant|respondent|defendant|plaintiff)\s*[:\-]\s*', '', name, flags=re.I)
+    # Remove leading court / section headers and 'Petitioner:'-style labels
+    name = _LEAD_JUNK_RE.sub('', name, count=1)
     # Remove citation-like tokens
-    name = re.sub(r'\(?\d{4}\)?\s*(SCC|SCR|AIR|All ER).*', '', name, flags=re.I)
+    name = _CITATION_TAIL_RE.sub('', name)
     # Truncate at "represented by", "through", etc.
-    name = re.split(r'\brepresented by\b|\bthrough\b|\bfiled\b|\bunder\b', name, flags=re.I)[0]
+    m = _TRUNCATE_AT_RE.search(name)
+    if m:
+        name = name[:m.start()]
     # Remove trailing role words
-    name = re.sub(r'\b(petitioner|appellant|respondent|defendant|plaintiff)\b$', '', name, flags=re.I)
+    name = _TRAIL_ROLE_RE.sub('', name)
     name = name.strip(" ,;:-")
     return name
 
 
+_LABEL_MAP = {
+    "CASE_NUMBER": "case_number",
+    "CASE": "case_number",
+    "COURT": "court",
+    "DATE": "date",
+    "JUDGE": "coram",
+    "CORAM": "coram",
+    "PETITIONER": "petitioner",
+    "APPELLANT": "petitioner",
+    "RESPONDENT": "respondent",
+    "PRECEDENT": "precedent",
+    "PRECEDENTS": "precedent",
+    "PROVISION": "provision",
+    "STATUTE": "statute",
+    "LAWYER": "lawyer",
+    "GPE": "gpe",
+    "ORGANIZATION": "organization",
+}
+
+
 def _label_key(label: str) -> str:
-    mapping = {
-        "CASE_NUMBER": "case_number",
-        "CASE": "case_number",
-        "COURT": "court",
-        "DATE": "date",
-        "JUDGE": "coram",
-        "CORAM": "coram",
-        "PETITIONER": "petitioner",
-        "APPELLANT": "petitioner",
-        "RESPONDENT": "respondent",
-        "PRECEDENT": "precedent",
-        "PRECEDENTS": "precedent",
-        "PROVISION": "provision",
-        "STATUTE": "statute",
-        "LAWYER": "lawyer",
-        "GPE": "gpe",
-        "ORGANIZATION": "organization",
-    }
-    return mapping.get(label.upper(), label.lower())
+    up = label.upper()
+    key = _LABEL_MAP.get(up)
+    return key if key is not None else up.lower()
 
 
 def _deduplicate_precedents(precedents: List[str]) -> List[str]:
     """
     Remove near-duplicate precedents using fuzzy matching
     """
-    from difflib import SequenceMatcher
-
     if not precedents:
         return []
 
-    unique = []
-    seen_base_names = set()
-
-    precedents_sorted = sorted(set(precedents), key=len, reverse=True)
-
-    for prec in precedents_sorted:
-        base = re.sub(r'\s*\(\d{4}\).*$', '', prec).strip()
-        base = re.sub(r'\s+(SCC|SCR|AIR).*$', '', base, flags=re.I).strip()
-        base_lower = base.lower()
+    # Normalize each precedent once up front: strip year/reporter tails,
+    # lowercase, and build its character 4-shingle set
+    prepared = []
+    for prec in sorted(set(precedents), key=len, reverse=True):
+        base = _PREC_YEAR_TAIL_RE.sub('', prec).strip()
+        base = _PREC_REPORTER_TAIL_RE.sub('', base).strip()
         if len(base) < 10:
             continue
+        base_lower = base.lower()
+        prepared.append((prec, {base_lower[i:i + 4] for i in range(len(base_lower) - 3)}))
+
+    unique = []
+    seen_shingles = []
+
+    for prec, shingles in prepared:
+        # Two names are duplicates when the smaller shingle set is mostly
+        # contained in the other. Containment (not Jaccard) keeps the old
+        # SequenceMatcher envelope: "v." vs "vs" and punctuation variants
+        # shift every shingle around the edit, which tanks Jaccard but
+        # leaves the shared shingles covering the shorter name.
         is_duplicate = False
-        for seen in seen_base_names:
-            if SequenceMatcher(None, base_lower, seen).ratio() > 0.85:
+        for seen in seen_shingles:
+            overlap = len(shingles & seen)
+            if overlap and overlap / min(len(shingles), len(seen)) > 0.85:
                 is_duplicate = True
                 break
         if not is_duplicate:
             unique.append(prec)
-            seen_base_names.add(base_lower)
+            seen_shingles.append(shingles)
 
     return unique[:15]
 
@@ -114,12 +170,14 @@ def merge_entities(bert_ents_list: List[Tuple[str, str]], spacy_regex_ents: List
     """
     Merge BERT and spaCy/regex entities into unified canonical dict.
     """
-    accum = defaultdict(list)
+    # Per key: (header_vals, bert_vals, spacy_vals) — values are routed
+    # to their priority bucket on insertion, no (val, prov) tuples
+    accum = defaultdict(lambda: ([], [], []))
 
     # 1) Collect BERT entities
     for label, raw in (bert_ents_list or []):
         lab = label.upper().strip()
-        m = re.match(r'^(.*?)(?:\s*\[(header|body)\])?\s*$', raw or '')
+        m = _PROVENANCE_RE.match(raw or '')
         if m:
             val = _clean_whitespace(m.group(1) or "")
             prov = (m.group(2) or "").lower()
@@ -132,9 +190,15 @@ def merge_entities(bert_ents_list: List[Tuple[str, str]], spacy_regex_ents: List
         if key == "statute":
             val = _normalize_statute(val)
         if key == "coram":
-            val = re.sub(r"Hon['’]?\s*ble\.?\s*", '', val, flags=re.I)
-            val = re.sub(r'\bMr\.?\s+Justice\b', 'Justice', val)
-        accum[key].append((val, prov or "bert"))
+            val = _HONBLE_RE.sub('', val)
+            val = _MR_JUSTICE_RE.sub('Justice', val)
+        if prov == "header":
+            accum[key][0].append(val)
+        elif not prov:
+            accum[key][1].append(val)
+        else:
+            # body-provenance BERT values rank with the spaCy tier
+            accum[key][2].append(val)
 
     # 2) Add spaCy/regex entities
     for label, val in (spacy_regex_ents or []):
@@ -144,50 +208,40 @@ def merge_entities(bert_ents_list: List[Tuple[str, str]], spacy_regex_ents: List
         v = _clean_whitespace(val)
         if key == "statute":
             v = _normalize_statute(v)
-        accum[key].append((v, "spacy"))
+        accum[key][2].append(v)
 
     # 3) Prioritize and clean
     final = {}
-    for key, items in accum.items():
-        header_vals, bert_vals, spacy_vals = [], [], []
-        for v, prov in items:
-            prov_l = (prov or "").lower()
-            if "header" in prov_l:
-                header_vals.append(v)
-            elif prov_l == "bert":
-                bert_vals.append(v)
-            else:
-                spacy_vals.append(v)
-
+    for key, (header_vals, bert_vals, spacy_vals) in accum.items():
         combined = header_vals + bert_vals + spacy_vals
 
         if key == "precedent":
             combined = _deduplicate_precedents(combined)
 
-        cleaned = []
-        seen = set()
+        # Insertion-ordered dict keyed on the lowered value dedups as we go
+        cleaned = {}
         for v in combined:
             if not v:
                 continue
             v2 = v.strip().strip('.,;:')
             if key == "coram":
-                if re.match(r'^(and|&|-)$', v2, re.I):
+                if _AND_ONLY_RE.match(v2):
                     continue
-                if len(v2.split()) == 1 and not re.search(r'justice', v2, re.I):
+                if len(v2.split()) == 1 and not _JUSTICE_WORD_RE.search(v2):
                     if not ('.' in v2 or v2.isupper()):
                         continue
-                v2 = re.sub(r"^(Hon['’]?\s*ble\.?\s*)", '', v2, flags=re.I).strip()
+                v2 = _LEAD_HONBLE_RE.sub('', v2).strip()
 
             if key in {"petitioner", "respondent"}:
                 v2 = _clean_party_name(v2)
                 if not v2 or len(v2.split()) < 2:
                     continue
             elif key == "organization":
-                if re.match(r'^[A-Z\s]{3,200}$', v2) and len(v2.split()) > 2:
+                if _CAPS_BANNER_RE.match(v2) and len(v2.split()) > 2:
                     continue
 
             if key == "lawyer":
-                v2 = re.sub(r'\b(Sr\.?\s*Adv|Advocate|Adv\.|A\.S\.G\.?|A\.A\.G\.?|AOR)\b', '', v2, flags=re.I).strip()
+                v2 = _LAWYER_ROLE_RE.sub('', v2).strip()
                 if not _is_probable_lawyer(v2):
                     continue
             if key == "statute":
@@ -197,13 +251,9 @@ def merge_entities(bert_ents_list: List[Tuple[str, str]], spacy_regex_ents: List
                 if len(v2) < 15:
                     continue
 
-            k_lower = v2.lower()
-            if k_lower in seen:
-                continue
-            seen.add(k_lower)
-            cleaned.append(v2)
+            cleaned.setdefault(v2.lower(), v2)
 
-        final[key] = cleaned
+        final[key] = list(cleaned.values())
 
     # 4) Ensure all expected keys exist
     expected = [
@@ -223,7 +273,7 @@ def merge_entities(bert_ents_list: List[Tuple[str, str]], spacy_regex_ents: List
     def _infer_parties_from_case_name(case_name):
         if not case_name or " v" not in case_name.lower():
             return None, None
-        parts = re.split(r'\s+v[.]?s?[.]?\s+', case_name, flags=re.I)
+        parts = _V_SPLIT_RE.split(case_name)
         if len(parts) == 2:
             return parts[0].strip(), parts[1].strip()
         return None, None
@@ -5,6 +5,34 @@
 import re
 from typing import Dict
 
+# Line-level heuristics run once per document line; all their patterns
+# are compiled at import instead of per call.
+# Deleting every allowed character must leave nothing; str.translate is
+# a C-level scan, cheaper than a regex match per line
+_UPPER_LINE_TRANS = str.maketrans('', '', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .-(),:[]')
+_HEADER_MARKERS_LOWER = tuple(m.lower() for m in (
+    "IN THE SUPREME COURT", "CIVIL APPELLATE", "CRIMINAL APPELLATE",
+    "IN THE HIGH COURT", "BENCH", "JUDGMENT", "CORAM", "CASE",
+    "Crl.O.P", "CRLMC", "CRIMINAL APPLICATION", "CIVIL APPEAL",
+    "Appearances for Parties", "Appearances", "Date of Judgment",
+))
+# "\b v\. \b" (the old spaced-caption check) is subsumed by "\b v\."
+_CAPTION_RE = re.compile(r'\b v\.|\bv\s+v\b| v\.? $', re.I)
+_CASE_SHORTFORM_RE = re.compile(r'\b(No\.|CRL|Crl\.O\.P|Crime No|C\.A\.|C\.C\.)\b', re.I)
+_ORDER_MARKER_RE = re.compile(
+    r'^\s*(?:O R D E R\b|ORDER\b|Held:|DISPOSED\b|CONCLUSION\b|JUDGMENT\b|TAKE NOTICE\b)',
+    re.I)
+# First characters of the transition markers; a set lookup on the
+# stripped line's first char skips the regex on almost every line
+_ORDER_FIRST_CHARS = frozenset('ohdcjtOHDCJT')
+_BODY_FIRST_CHARS = frozenset('ibfjhIBFJH')
+_BODY_START_RE = re.compile(
+    r'^\s*(Issue for Consideration|Issue|Background|Facts|Background and Facts|From the Judgment|Judgment|Heard)',
+    re.I)
+_PROSE_VERB_RE = re.compile(
+    r'\b(is|are|was|were|held|observed|submitted|submitted that|observed that)\b', re.I)
+_HELD_LINE_RE = re.compile(r'^(?:Held:|ORDER|O R D E R:)', re.I)
+
 
 class Segmenter:
     """
@@ -29,23 +57,19 @@ class Segmenter:
         if not line:
             return False
         # long uppercase lines often belong to header but exclude lines that look like long sentences
-        if re.match(r'^[A-Z0-9 \.\-\(\)\,\:\[\]]{5,200}$', line) and len(line.split()) <= 12:
+        if 5 <= len(line) <= 200 and not line.translate(_UPPER_LINE_TRANS) \
+                and len(line.split()) <= 12:
             return True
-        # obvious header markers
-        header_markers = [
-            "IN THE SUPREME COURT", "CIVIL APPELLATE", "CRIMINAL APPELLATE",
-            "IN THE HIGH COURT", "BENCH", "JUDGMENT", "CORAM", "CASE",
-            "Crl.O.P", "CRLMC", "CRIMINAL APPLICATION", "CIVIL APPEAL",
-            "Appearances for Parties", "Appearances", "Date of Judgment"
-        ]
-        for m in header_markers:
-            if m.lower() in line.lower():
+        # obvious header markers (line lowered once, not per marker)
+        line_lower = line.lower()
+        for m in _HEADER_MARKERS_LOWER:
+            if m in line_lower:
                 return True
         # common caption pattern: "X v. Y" or "v." on its own line
-        if re.search(r'\b v\.|\bv\s+v\b| v\.? $', line, re.I) or re.search(r'\b v\. \b', line):
+        if _CAPTION_RE.search(line):
             return True
         # case number shortforms
-        if re.search(r'\b(No\.|CRL|Crl\.O\.P|Crime No|C\.A\.|C\.C\.)\b', line, re.I):
+        if _CASE_SHORTFORM_RE.search(line):
             return True
         return False
 
@@ -53,14 +77,7 @@ class Segmenter:
         """
         Detect start of final operative order section.
         """
-        order_markers = [
-            r'^\s*O R D E R\b', r'^\s*ORDER\b', r'^\s*Held:', r'^\s*DISPOSED\b',
-            r'^\s*CONCLUSION\b', r'^\s*JUDGMENT\b', r'^\s*TAKE NOTICE\b'
-        ]
-        for pat in order_markers:
-            if re.search(pat, line, re.I):
-                return True
-        return False
+        return line[:1] in _ORDER_FIRST_CHARS and _ORDER_MARKER_RE.match(line) is not None
 
     def split_segments(self) -> Dict[str, str]:
         """
@@ -96,7 +113,7 @@ class Segmenter:
             # Detect transition from header -> body using heuristics
             if state == "header":
                 # If we encounter words that typically start reasoning
-                if re.search(r'^\s*(Issue for Consideration|Issue|Background|Facts|Background and Facts|From the Judgment|Judgment|Heard)', stripped, re.I):
+                if stripped[0] in _BODY_FIRST_CHARS and _BODY_START_RE.search(stripped):
                     state = "body"
                     body_started_at = i
                     body_lines.append(stripped)
@@ -108,7 +125,7 @@ class Segmenter:
                     body_lines.append(stripped)
                     continue
                 # If a line doesn't look like header and contains verbs (thus likely prose), treat as body
-                if not self._is_header_line(stripped) and re.search(r'\b(is|are|was|were|held|observed|submitted|submitted that|observed that)\b', stripped, re.I):
+                if not self._is_header_line(stripped) and _PROSE_VERB_RE.search(stripped):
                     state = "body"
                     body_started_at = i
                     body_lines.append(stripped)
@@ -129,12 +146,12 @@ class Segmenter:
 
         # If 'order' is empty but body contains clear 'Held:' or 'Order' near end, split heuristically
         if not order and body:
-            # look for 'Held:' or 'Order' inside body and split there
-            m = re.search(r'(?:\n|^)(Held:|ORDER|O R D E R:|ORDER:)(.*)$', body, re.I | re.S)
-            if m:
-                before = body[:m.start()].strip()
-                after = body[m.start():].strip()
-                body = before
-                order = after
+            # look for a line starting with 'Held:' or 'Order' and split there
+            split_lines = body.splitlines()
+            for i, line in enumerate(split_lines):
+                if _HELD_LINE_RE.match(line):
+                    body = "\n".join(split_lines[:i]).strip()
+                    order = "\n".join(split_lines[i:]).strip()
+                    break
 
         return {"header": header, "body": body, "order": order}
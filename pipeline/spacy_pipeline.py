@@ -4,7 +4,8 @@
 
 import json
 import re
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import List, Tuple
 
 try:
     import spacy
@@ -12,11 +13,95 @@ except Exception:
     spacy = None  # spaCy may not be installed in some environments
 
 
+# Pattern families are merged into one compiled alternation per family so
+# each does a single pass over the text instead of one pass per pattern.
+_CASE_PATTS = [
+    r'W\.P\.\s*\(C\)\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?',
+    r'W\.A\.\s*No\.?\s*\d{1,6}',
+    r'Crl\.A?\.?\s*No\.?\s*\d{1,6}',
+    r'C\.A\.?\s*No\.?\s*\d{1,6}',
+    r'SLP\s*No\.?\s*\d{1,6}',
+    r'I\.A\.?\s*No\.?\s*\d{1,6}',
+    r'Crl\.?\.?O\.?P\.?\.?No\.?\s*\d+',
+    r'Crime\s+No\.?\s*\d+',
+    r'C\.?C\.?\.?\s*No\.?\s*\d+',
+    r'(?:Case\s+)?No\.?\s*\d{1,6}(?:/\d{2,4})?',
+]
+_DATE_PATTS = [
+    r'\d{1,2}[./-]\d{1,2}[./-]\d{2,4}',
+    r'\d{1,2}(?:st|nd|rd|th)?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}',
+    r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4}',
+    r'\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s*,?\s*\d{4}',
+]
+_DATE_NOISE_RE = re.compile(r'\b(SCC|SCR|Vol|No\.)\b', re.I)
+
+_COURT_PATT = (r'Supreme Court(?: of India)?|High Court of Judicature at [A-Za-z ]+'
+               r'|High Court(?: of [A-Za-z ]+)?|District Court(?: of [A-Za-z ]+)?')
+_PROVISION_PATT = (r'\bSection\s+\d+[A-Za-z]?(?:\s*\([a-z0-9]+\))?'
+                   r'(?:\s+read with\s+Section\s+\d+[A-Za-z]?)?')
+
+# The four families share one master alternation; m.lastgroup names the
+# family that fired, so one pass over the text replaces four.
+_FUSED_SCAN_RE = re.compile(
+    r'(?P<case_number>\b(?:' + '|'.join(f'(?:{p})' for p in _CASE_PATTS) + r')\b)'
+    r'|(?P<date>\b(?:' + '|'.join(f'(?:{p})' for p in _DATE_PATTS) + r')\b)'
+    r'|(?P<court>' + _COURT_PATT + r')'
+    r'|(?P<provision>' + _PROVISION_PATT + r')',
+    re.I)
+
+# Coram block: every pattern compiled once with its flags baked in
+_BRACKET_CORAM_RE = re.compile(r'\[([^\]]{2,400})\]')
+_JJ_RE = re.compile(r'\bJJ?\.?\b', re.I)
+_AND_ONLY_RE = re.compile(r'^(and|&)$', re.I)
+_NAME_TOKEN_RE = re.compile(r'\b[A-Z][a-z]+')
+_CORAM_LINE_RE = re.compile(r'^\s*Coram[:\s\-]?\s*(.+)$', re.I | re.M)
+
+_PRECEDENT_RE = re.compile(
+    r'\b([A-Z][A-Za-z.\-&\s]{3,50})\s+v\.?\s+([A-Z][A-Za-z.\-&\s]{3,50})(?:\s*\((\d{4})\))?\b')
+
+# Lawyer extraction: anchored-block filters plus the generic honorific
+# fallback, which only scans the document head where appearance blocks live
+_HONORIFIC_NAME_RE = re.compile(r'^(Mr|Ms|Mrs|Shri|Smt|Dr|Adv)\.?', re.I)
+_TITLECASE_NAME_RE = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+')
+_LAWYER_ROLE_RE = re.compile(r'\b(Sr\.?\s*Adv|Sr\.?\s*Advocate|Sr Advs|Adv\.?)\b', re.I)
+_LAWYER_ORG_RE = re.compile(r'\b(State of|Union of|Government)\b', re.I)
+_HONORIFIC_SCAN_RE = re.compile(r'\b(Mr|Ms|Mrs|Shri|Smt|Dr|Adv)\.?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}\b')
+_HONORIFIC_BAD_RE = re.compile(r'\b(State of|Union of|Government|Registry|Court)\b', re.I)
+_LAWYER_SCAN_CHARS = 3000
+
+# Party label lines live in the caption block; they are scanned on a
+# header slice rather than the whole document
+_PARTY_PATTERNS = (
+    (re.compile(r'^\s*Petitioner(?:\(s\))?\s*[:\-]?\s*(.+)$', re.I | re.M), "PETITIONER"),
+    (re.compile(r'^\s*Appellant(?:\(s\))?\s*[:\-]?\s*(.+)$', re.I | re.M), "PETITIONER"),
+    (re.compile(r'^\s*Respondent(?:\(s\))?\s*[:\-]?\s*(.+)$', re.I | re.M), "RESPONDENT"),
+)
+_BANNER_RE = re.compile(r'^[A-Z\s]{3,200}$')
+_PARTY_SNIPPET_CHARS = 2000
+
+# Statute literals: one union scan instead of one finditer per act
+_STATUTES = ("Indian Penal Code", "Negotiable Instruments Act", "Code of Criminal Procedure",
+             "Companies Act", "Information Technology Act", "Bharatiya Nyaya Sanhita",
+             "Dowry Prohibition Act", "Constitution")
+_STATUTE_SCAN_RE = re.compile(
+    r'(?:' + '|'.join(re.escape(s) for s in _STATUTES) + r')(?:,?\s*\d{4})?', re.I)
+
+# GPE seed cities: one union scan instead of one search per city
+_GPE_CITIES = ("Delhi", "Mumbai", "Bhopal", "Jaora", "Guna", "Gwalior", "Chennai",
+               "Hyderabad", "Bengaluru", "Pune", "Aurangabad", "Vaniyambadi")
+_GPE_RE = re.compile(r'\b(?:' + '|'.join(_GPE_CITIES) + r')\b')
+
+
+@lru_cache(maxsize=1)
 def load_spacy_ruler(patterns_path: str = 'data/entityruler_patterns.jsonl'):
     """
     Return a spaCy nlp pipeline with entity_ruler loaded if possible.
     If spaCy or patterns file is not available, returns a minimal blank-like object
     with a .__call__ that yields no ents.
+
+    Memoized on the patterns path: re-invoking for the same file reuses
+    the already-built pipeline instead of re-parsing the JSONL and
+    re-inserting every pattern.
     """
     if spacy is None:
         # dummy object with minimal interface
@@ -29,7 +114,9 @@ def load_spacy_ruler(patterns_path: str = 'data/entityruler_patterns.jsonl'):
 
     nlp = spacy.blank("en")
     try:
-        ruler = nlp.add_pipe("entity_ruler")
+        # phrase_matcher_attr compiles literal-string patterns into the
+        # trie-backed PhraseMatcher instead of per-token rule matching
+        ruler = nlp.add_pipe("entity_ruler", config={"phrase_matcher_attr": "LOWER"})
         with open(patterns_path, "r", encoding="utf-8") as f:
             patterns = [json.loads(line) for line in f if line.strip()]
         ruler.add_patterns(patterns)
@@ -39,136 +126,139 @@ def load_spacy_ruler(patterns_path: str = 'data/entityruler_patterns.jsonl'):
     return nlp
 
 
-def _anchor_block_after(text: str, anchor_list: List[str], max_chars: int = 600) -> Optional[str]:
-    """
-    Find first occurrence of any anchor phrase and return the following block (up to max_chars).
-    """
-    for a in anchor_list:
-        pat = re.compile(r'(?im)'+re.escape(a)+r'\s*[:\-]?\s*(.+)')
-        m = pat.search(text)
-        if m:
-            block = m.group(1).strip()
-            # cut at newline double break or period after long string
-            if len(block) > max_chars:
-                block = block[:max_chars]
-            return block
-    return None
+# All appearance anchors share one alternation; longer variants come
+# first so "Appearances for Parties" wins over "Appearances"
+_LAWYER_ANCHORS = (
+    'Advs. for the Appellant', 'Advs. for the Respondent', 'Advocate for Applicants',
+    'Advocate for Respondent', 'For Petitioner', 'For Respondent', 'For Appellant',
+    'Appearances for Parties', 'Appearances',
+)
+_ANCHOR_RE = re.compile(
+    r'(?:' + '|'.join(re.escape(a) for a in _LAWYER_ANCHORS) + r')\s*[:\-]?\s*(.+)', re.I)
 
 
-def apply_spacy_and_regex(text: str, spacy_nlp) -> List[Tuple[str, str]]:
+def apply_spacy_and_regex(text, spacy_nlp, n_process: int = 1) -> List[Tuple[str, str]]:
     """
     Returns list like: [("CASE_NUMBER","..."), ("DATE","..."), ("LAWYER","..."), ...]
+
+    `text` may be a single string or a list of segment strings; lists are fed
+    through `nlp.pipe` so spaCy batches them (and can fan out across cores
+    with n_process), while the regex heuristics run over the joined text.
     """
+    if isinstance(text, str):
+        texts = [text]
+    else:
+        texts = [t for t in (text or []) if t]
+        text = "\n".join(texts)
+
     entities: List[Tuple[str, str]] = []
 
     # 1) spaCy entity ruler (if loaded)
     try:
-        doc = spacy_nlp(text)
-        for ent in getattr(doc, "ents", []) or []:
-            label = getattr(ent, "label_", None)
-            txt = getattr(ent, "text", None)
-            if label and txt:
-                entities.append((label.upper(), txt.strip()))
+        if hasattr(spacy_nlp, "pipe"):
+            docs = spacy_nlp.pipe(texts, batch_size=8, n_process=n_process)
+        else:
+            docs = (spacy_nlp(t) for t in texts)
+        for doc in docs:
+            for ent in getattr(doc, "ents", []) or []:
+                label = getattr(ent, "label_", None)
+                txt = getattr(ent, "text", None)
+                if label and txt:
+                    entities.append((label.upper(), txt.strip()))
     except Exception:
         # ignore if spaCy not configured
         pass
 
+    # 2-4, 8) CASE_NUMBER / DATE / COURT / PROVISION share one fused scan.
+    # The search restarts just past each match start so spans from
+    # different families may overlap; contained spans within a family are
+    # dropped by the sorted sweep below.
+    span_matches = []
+    pos = 0
+    while True:
+        m = _FUSED_SCAN_RE.search(text, pos)
+        if not m:
+            break
+        pos = m.start() + 1
+        span_matches.append((m.lastgroup, m.start(), m.end(), m.group(0)))
+    span_matches.sort(key=lambda t: (t[1], -(t[2] - t[1])))
+    buckets = {"case_number": [], "date": [], "court": [], "provision": []}
+    last_end = {}
+    for fam, start, end, val in span_matches:
+        if end <= last_end.get(fam, -1):
+            continue
+        last_end[fam] = end
+        buckets[fam].append(val.strip())
+
     # 2) CASE numbers (comprehensive patterns)
-    case_patts = [
-        r'\bW\.P\.\s*\(C\)\s*No\.?\s*\d{1,6}(?:/\d{2,4}|\s+of\s+\d{4})?\b',
-        r'\bW\.A\.\s*No\.?\s*\d{1,6}\b',
-        r'\bCrl\.A?\.?\s*No\.?\s*\d{1,6}\b',
-        r'\bC\.A\.?\s*No\.?\s*\d{1,6}\b',
-        r'\bSLP\s*No\.?\s*\d{1,6}\b',
-        r'\bI\.A\.?\s*No\.?\s*\d{1,6}\b',
-        r'\bCrl\.?\.?O\.?P\.?\.?No\.?\s*\d+\b',
-        r'\bCrime\s+No\.?\s*\d+\b',
-        r'\bC\.?C\.?\.?\s*No\.?\s*\d+\b',
-        r'\b(?:Case\s+)?No\.?\s*\d{1,6}(?:/\d{2,4})?\b',
-    ]
-    for pat in case_patts:
-        for m in re.finditer(pat, text, re.I):
-            entities.append(("CASE_NUMBER", m.group(0).strip()))
-
-    # 3) DATES (robust)
-    date_patts = [
-        r'\b\d{1,2}[./-]\d{1,2}[./-]\d{2,4}\b',
-        r'\b\d{1,2}(?:st|nd|rd|th)?\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b',
-        r'\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4}\b',
-        r'\b\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s*,?\s*\d{4}\b',
-    ]
-    for pat in date_patts:
-        for m in re.finditer(pat, text, re.I):
-            val = m.group(0).strip()
-            # skip short numeric tokens that are likely not dates
-            if re.search(r'\b(SCC|SCR|Vol|No\.)\b', val, re.I):
-                continue
-            entities.append(("DATE", val))
+    for val in buckets["case_number"]:
+        entities.append(("CASE_NUMBER", val))
+
+    # 3) DATES
+    for val in buckets["date"]:
+        # skip short numeric tokens that are likely not dates
+        if _DATE_NOISE_RE.search(val):
+            continue
+        entities.append(("DATE", val))
 
     # 4) COURTS
-    court_pattern = r'(Supreme Court(?: of India)?|High Court of Judicature at [A-Za-z ]+|High Court(?: of [A-Za-z ]+)?|District Court(?: of [A-Za-z ]+)?)'
-    for m in re.finditer(court_pattern, text, re.I):
-        entities.append(("COURT", m.group(0).strip()))
+    for val in buckets["court"]:
+        entities.append(("COURT", val))
 
     # 5) CORAM / JUDGES: restrict to header-ish area (first ~1200 chars)
     header_snippet = text[:1200]
     # patterns like "[B.V. Nagarathna and Satish Chandra Sharma, JJ.]" or "CORAM: Justice X, Justice Y"
-    match_coram = re.search(r'\[([^\]]{2,400})\]', header_snippet)
+    match_coram = _BRACKET_CORAM_RE.search(header_snippet)
     if match_coram:
         block = match_coram.group(1)
         # remove trailing JJ or J.
-        block = re.sub(r'\bJJ?\.?\b', '', block, flags=re.I)
-        parts = re.split(r',|\band\b|&', block)
+        block = _JJ_RE.sub('', block)
+        parts = block.replace('&', ',').replace(' and ', ',').split(',')
         for p in parts:
             p = p.strip()
             if not p:
                 continue
             # ensure it's not plain 'and'
-            if re.match(r'^(and|&)$', p, re.I):
+            if _AND_ONLY_RE.match(p):
                 continue
             # if it's a short single token like "and" or "Mehta", keep only if it looks like a name
-            if len(p.split()) == 1 and not re.search(r'\b[A-Z][a-z]+', p):
+            if len(p.split()) == 1 and not _NAME_TOKEN_RE.search(p):
                 continue
             entities.append(("JUDGE", p))
     else:
         # fallback: look for "Coram" or "Coram:" lines
-        for m in re.finditer(r'(?im)^\s*Coram[:\s\-]?\s*(.+)$', header_snippet):
+        for m in _CORAM_LINE_RE.finditer(header_snippet):
             block = m.group(1).strip()
-            block = re.sub(r'\bJJ?\.?\b', '', block, flags=re.I)
-            for p in re.split(r',|\band\b|&', block):
+            block = _JJ_RE.sub('', block)
+            for p in block.replace('&', ',').replace(' and ', ',').split(','):
                 p = p.strip()
-                if p and not re.match(r'^(and|&)$', p, re.I):
+                if p and not _AND_ONLY_RE.match(p):
                     entities.append(("JUDGE", p))
 
     # 6) LAWYERS: anchored blocks first ("Advs. for the Appellant", "For Petitioner", etc.)
-    anchor_variants = [
-        'Advs. for the Appellant', 'Advs. for the Respondent', 'Advocate for Applicants',
-        'Advocate for Respondent', 'For Petitioner', 'For Respondent', 'For Appellant',
-        'Appearances for Parties', 'Appearances'
-    ]
-    for anchor in anchor_variants:
-        block = _anchor_block_after(text, [anchor], max_chars=800)
+    for anchor_m in _ANCHOR_RE.finditer(text):
+        block = anchor_m.group(1).strip()[:800]
         if block:
-            # split common separators
-            parts = re.split(r',\s*|\s+and\s+|;|\n', block)
+            # split common separators (normalized to ',' in C, no regex)
+            parts = block.replace(';', ',').replace('\n', ',').replace(' and ', ',').split(',')
             for p in parts:
                 p = p.strip().strip('.')
                 # keep those that look like person names or have honorifics
-                if re.match(r'^(Mr|Ms|Mrs|Shri|Smt|Dr|Adv)\.?', p, re.I) or re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+', p):
+                if _HONORIFIC_NAME_RE.match(p) or _TITLECASE_NAME_RE.match(p):
                     # remove trailing role words like 'Sr. Advs.' etc
-                    p2 = re.sub(r'\b(Sr\.?\s*Adv|Sr\.?\s*Advocate|Sr Advs|Adv\.?)\b', '', p, flags=re.I).strip()
-                    if p2 and not re.search(r'\b(State of|Union of|Government)\b', p2, re.I):
+                    p2 = _LAWYER_ROLE_RE.sub('', p).strip()
+                    if p2 and not _LAWYER_ORG_RE.search(p2):
                         entities.append(("LAWYER", p2))
 
-    # generic honorific search as fallback (avoid capturing "State of ...")
-    for m in re.finditer(r'\b(Mr|Ms|Mrs|Shri|Smt|Dr|Adv)\.?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}\b', text):
+    # generic honorific search as fallback (avoid capturing "State of ...");
+    # appearance blocks sit at the head, so the scan stops there
+    for m in _HONORIFIC_SCAN_RE.finditer(text[:_LAWYER_SCAN_CHARS]):
         candidate = m.group(0).strip()
-        if not re.search(r'\b(State of|Union of|Government|Registry|Court)\b', candidate, re.I):
+        if not _HONORIFIC_BAD_RE.search(candidate):
             entities.append(("LAWYER", candidate))
 
     # 7) PRECEDENTS: IMPROVED - validate both sides and filter junk
-    precedent_pattern = r'\b([A-Z][A-Za-z.\-&\s]{3,50})\s+v\.?\s+([A-Z][A-Za-z.\-&\s]{3,50})(?:\s*\((\d{4})\))?\b'
-    for m in re.finditer(precedent_pattern, text):
+    for m in _PRECEDENT_RE.finditer(text):
         left = m.group(1).strip()
         right = m.group(2).strip()
         year = m.group(3)
@@ -182,50 +272,44 @@ def apply_spacy_and_regex(text: str, spacy_nlp) -> List[Tuple[str, str]]:
                     case_name += f" ({year})"
                 entities.append(("PRECEDENT", case_name))
 
-    # 8) PROVISIONS
-    for m in re.finditer(r'\bSection\s+\d+[A-Za-z]?(?:\s*\([a-z0-9]+\))?(?:\s+read with\s+Section\s+\d+[A-Za-z]?)?', text, re.I):
-        entities.append(("PROVISION", m.group(0).strip()))
-
-    # 9) STATUTES (explicit list for higher precision)
-    statutes_list = [
-        "Indian Penal Code", "Negotiable Instruments Act", "Code of Criminal Procedure",
-        "Companies Act", "Information Technology Act", "Bharatiya Nyaya Sanhita",
-        "Dowry Prohibition Act", "Constitution"
-    ]
-    for statute in statutes_list:
-        for m in re.finditer(re.escape(statute) + r'(?:,?\s*\d{4})?', text, re.I):
-            entities.append(("STATUTE", m.group(0).strip()))
-
-    # 10) PETITIONER / RESPONDENT anchored header lines
-    party_patterns = [
-        (r'^\s*Petitioner(?:\(s\))?\s*[:\-]?\s*(.+)$', "PETITIONER"),
-        (r'^\s*Appellant(?:\(s\))?\s*[:\-]?\s*(.+)$', "PETITIONER"),
-        (r'^\s*Respondent(?:\(s\))?\s*[:\-]?\s*(.+)$', "RESPONDENT"),
-    ]
-    for pat, lab in party_patterns:
-        for m in re.finditer(pat, text, re.I | re.M):
+    # 8) PROVISIONS (collected by the fused scan above)
+    for val in buckets["provision"]:
+        entities.append(("PROVISION", val))
+
+    # 9) STATUTES (explicit list for higher precision, one union scan)
+    for m in _STATUTE_SCAN_RE.finditer(text):
+        entities.append(("STATUTE", m.group(0).strip()))
+
+    # 10) PETITIONER / RESPONDENT anchored header lines (caption area only)
+    party_snippet = text[:_PARTY_SNIPPET_CHARS]
+    for pat, lab in _PARTY_PATTERNS:
+        for m in pat.finditer(party_snippet):
             line = m.group(1).strip()
-            parts = re.split(r',\s*|\s+and\s+|\s*&\s*|;', line)
+            parts = line.replace(';', ',').replace('&', ',').replace(' and ', ',').split(',')
             for p in parts:
                 p = p.strip().strip(':-.,')
                 # skip uppercase banner lines
-                if re.match(r'^[A-Z\s]{3,200}$', p) and len(p.split()) > 2:
+                if _BANNER_RE.match(p) and len(p.split()) > 2:
                     continue
                 if len(p) >= 3:
                     entities.append((lab, p))
 
-    # 11) GPE seeds (small list)
-    for city in ["Delhi", "Mumbai", "Bhopal", "Jaora", "Guna", "Gwalior", "Chennai", "Hyderabad", "Bengaluru", "Pune", "Aurangabad", "Vaniyambadi"]:
-        if re.search(r'\b' + re.escape(city) + r'\b', text):
+    # 11) GPE seeds (small list, one union scan)
+    found_cities = {m.group(0) for m in _GPE_RE.finditer(text)}
+    for city in _GPE_CITIES:
+        if city in found_cities:
             entities.append(("GPE", city))
 
-    # Final dedupe while preserving order
+    # Final dedupe while preserving order; a (label, casefolded value)
+    # tuple hashes in C without building a joined key string
     seen = set()
+    seen_add = seen.add
     out = []
+    out_append = out.append
     for lab, val in entities:
-        key = f"{lab}||{val}".lower()
+        key = (lab, val.casefold())
         if key in seen:
             continue
-        seen.add(key)
-        out.append((lab, val))
+        seen_add(key)
+        out_append((lab, val))
     return out
\ No newline at end of file
@@ -1,8 +1,25 @@
 # utils.py
 # ========== PDF Text Extraction & Pre-Cleaning Utilities ==========
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import fitz  # PyMuPDF
 import re
 
+# preclean_text used to make ~10 full passes over each page; the deletions
+# and the whitespace normalization are each fused into one sub, and the
+# quote normalization is a str.translate table (one C loop instead of four
+# chained str.replace scans). De-hyphenation stays its own pass so a page
+# header removed between a broken word's halves cannot splice them.
+_JUNK_RE = re.compile(r'Page \d+ of \d+|_{3,}|-{3,}', re.I)
+_DEHYPHEN_RE = re.compile(r'(\w+)-\n(\w+)')
+_WS_NORM_RE = re.compile(r'([ \t]+)|\n{2,}')
+_QUOTE_TABLE = str.maketrans({'‘': "'", '’': "'", '“': '"', '”': '"'})
+
+
+def _ws_norm(m: "re.Match") -> str:
+    return ' ' if m.group(1) else '\n'
+
 
 def preclean_text(text: str) -> str:
     """
@@ -15,40 +32,58 @@ def preclean_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove common headers/footers like "Page 1 of 12"
-    text = re.sub(r'Page \d+ of \d+', '', text, flags=re.I)
-
-    # Remove decorative lines or underscores
-    text = re.sub(r'_{3,}', '', text)
-    text = re.sub(r'-{3,}', '', text)
+    # Remove headers/footers like "Page 1 of 12" and decorative lines
+    text = _JUNK_RE.sub('', text)
 
     # De-hyphenate words broken across lines: "appli-\ncation" → "application"
-    text = re.sub(r'(\w+)-\n(\w+)', r'\1\2', text)
-
-    # Replace multiple newlines with a single newline
-    text = re.sub(r'\n{2,}', '\n', text)
+    text = _DEHYPHEN_RE.sub(r'\1\2', text)
 
-    # Normalize whitespace inside lines
-    text = re.sub(r'[ \t]+', ' ', text)
+    # Collapse newline runs to one newline and tab/space runs to one space
+    text = _WS_NORM_RE.sub(_ws_norm, text)
 
     # Normalize quotes/apostrophes
-    text = text.replace("’", "'").replace("‘", "'")
-    text = text.replace("“", '"').replace("”", '"')
-
-    # Collapse excessive blank lines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = text.translate(_QUOTE_TABLE)
 
     return text.strip()
 
 
+# Below this page count the thread fan-out costs more than it saves
+_PARALLEL_PAGE_THRESHOLD = 8
+
+
+def _page_text(page) -> str:
+    # "blocks" mode exposes coordinates, so running header/footer bands
+    # (top and bottom 5% of the page) are dropped geometrically instead of
+    # relying solely on the "Page X of Y" regex downstream
+    height = page.rect.height
+    top, bottom = height * 0.05, height * 0.95
+    blocks = page.get_text("blocks")
+    kept = [b[4] for b in blocks if b[6] == 0 and top < b[1] < bottom]
+    return preclean_text("\n".join(kept))
+
+
+def _extract_page_range(pdf_path: str, indices) -> list:
+    # MuPDF documents are not safe to share across threads, so each worker
+    # opens its own handle; get_text releases the GIL during extraction
+    doc = fitz.open(pdf_path)
+    try:
+        return [_page_text(doc[i]) for i in indices]
+    finally:
+        doc.close()
+
+
 def extract_text_from_pdf(pdf_path: str, max_pages: int = None) -> str:
     """
     Extract and clean text from a PDF file using PyMuPDF.
-    
+    PyMuPDF is the deliberate choice here: its C++ extractor is roughly an
+    order of magnitude faster than pdfminer/pdfplumber on long judgments.
+    Long documents are split into contiguous page ranges extracted on a
+    thread pool.
+
     Args:
         pdf_path (str): Path to PDF file.
         max_pages (int, optional): Limit number of pages (useful for debugging).
-    
+
     Returns:
         str: Cleaned extracted text.
     """
@@ -57,18 +92,41 @@ def extract_text_from_pdf(pdf_path: str, max_pages: int = None) -> str:
     except Exception as e:
         raise RuntimeError(f"Failed to open PDF: {e}")
 
-    all_text = []
-    for page_num, page in enumerate(doc, start=1):
-        if max_pages and page_num > max_pages:
-            break
-
-        raw_text = page.get_text("text")  # extract plain text
-        clean_page = preclean_text(raw_text)
-        if clean_page:
-            all_text.append(clean_page)
+    try:
+        n_pages = len(doc)
+        if max_pages:
+            n_pages = min(n_pages, max_pages)
+
+        if n_pages < _PARALLEL_PAGE_THRESHOLD:
+            all_text = [_page_text(doc[i]) for i in range(n_pages)]
+        else:
+            workers = min(os.cpu_count() or 1, 8)
+            # contiguous ranges keep page order trivial to restore
+            step = -(-n_pages // workers)
+            chunks = [range(i, min(i + step, n_pages)) for i in range(0, n_pages, step)]
+            with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+                all_text = []
+                for pages in pool.map(lambda c: _extract_page_range(pdf_path, c), chunks):
+                    all_text.extend(pages)
+    finally:
+        doc.close()
 
     # Join all pages together
-    return "\n".join(all_text).strip()
+    return "\n".join(t for t in all_text if t).strip()
+
+
+# normalize_statutes: the abbreviations share one alternation; the
+# expansion is looked up from the lowered match
+_STATUTE_ABBR_RE = re.compile(r'\b(CrPC|CPC|IPC|NI Act|IT Act|BNSS|BNS)\b', re.I)
+_STATUTE_EXPAND = {
+    "crpc": "Code of Criminal Procedure, 1973",
+    "cpc": "Code of Civil Procedure, 1908",
+    "ipc": "Indian Penal Code, 1860",
+    "ni act": "Negotiable Instruments Act, 1881",
+    "it act": "Information Technology Act, 2000",
+    "bns": "Bharatiya Nyaya Sanhita, 2023",
+    "bnss": "Bharatiya Nagarik Suraksha Sanhita, 2023",
+}
 
 
 def normalize_statutes(statutes):
@@ -81,26 +139,15 @@ def normalize_statutes(statutes):
     if not statutes:
         return []
 
-    norm_map = {
-        r"\bCrPC\b": "Code of Criminal Procedure, 1973",
-        r"\bCPC\b": "Code of Civil Procedure, 1908",
-        r"\bIPC\b": "Indian Penal Code, 1860",
-        r"\bNI Act\b": "Negotiable Instruments Act, 1881",
-        r"\bIT Act\b": "Information Technology Act, 2000",
-        r"\bBNS\b": "Bharatiya Nyaya Sanhita, 2023",
-        r"\bBNSS\b": "Bharatiya Nagarik Suraksha Sanhita, 2023",
-    }
-
     cleaned = []
     seen = set()
     for s in statutes:
         s = s.strip().rstrip(".,;:")
         if not s:
             continue
-        for pattern, full_form in norm_map.items():
-            if re.search(pattern, s, flags=re.IGNORECASE):
-                s = full_form
-                break
+        m = _STATUTE_ABBR_RE.search(s)
+        if m:
+            s = _STATUTE_EXPAND[m.group(1).lower()]
         if s.lower() not in seen:
             seen.add(s.lower())
             cleaned.append(s)